@@ -1,10 +1,21 @@
 import csv
 import datetime
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Dict, Iterator, List, Optional, Set
+from sys import intern
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
+_CSV_BUFFER_SIZE: int = 1 << 20
 
-@dataclass
+# Separator Google uses for multiple values within a single cell
+_SEP: str = " ::: "
+
+# Columns of multi-column blocks, eg: "Address 1 - Street"
+_BLOCK_COLUMN_RE = re.compile(r"^(.+?) (\d+) - (.+)$")
+
+
+@dataclass(frozen=True, slots=True)
 class Address:
     street: Optional[str]
     city: Optional[str]
@@ -14,11 +25,8 @@ class Address:
     country: Optional[str]
     extended_address: Optional[str]
 
-    def __hash__(self) -> int:
-        return id(self)
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Organization:
     name: Optional[str]
     yomi_name: Optional[str]
@@ -28,11 +36,8 @@ class Organization:
     location: Optional[str]
     job_description: Optional[str]
 
-    def __hash__(self) -> int:
-        return id(self)
-
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     given_name: Optional[str]  # UI
     additional_name: Optional[str]  # UI
@@ -72,67 +77,72 @@ class Contact:
     custom_fields: Dict[str, Set[str]]  # UI
 
     def __post_init__(self) -> None:
-        assert self.given_name != ""
-        assert self.additional_name != ""
-        assert self.family_name != ""
-        assert self.given_name_yomi != ""
-        assert self.additional_name_yomi != ""
-        assert self.family_name_yomi != ""
-        assert self.name_prefix != ""
-        assert self.name_suffix != ""
-        assert self.initials != ""
-        assert self.nickname != ""
-        assert self.short_name != ""
-        assert self.maiden_name != ""
-        assert self.birthday != ""
-        assert self.gender != ""
-        assert self.location != ""
-        assert self.billing_information != ""
-        assert self.directory_server != ""
-        assert self.mileage != ""
-        assert self.occupation != ""
-        assert self.hobby != ""
-        assert self.sensitivity != ""
-        assert self.priority != ""
-        assert self.subject != ""
-        assert self.notes != ""
-        assert self.language != ""
-        assert self.photo != ""
-        assert self.group_membership != ""
+        assert "" not in (
+            self.given_name,
+            self.additional_name,
+            self.family_name,
+            self.given_name_yomi,
+            self.additional_name_yomi,
+            self.family_name_yomi,
+            self.name_prefix,
+            self.name_suffix,
+            self.initials,
+            self.nickname,
+            self.short_name,
+            self.maiden_name,
+            self.gender,
+            self.location,
+            self.billing_information,
+            self.directory_server,
+            self.mileage,
+            self.occupation,
+            self.hobby,
+            self.sensitivity,
+            self.priority,
+            self.subject,
+            self.notes,
+            self.language,
+            self.photo,
+        )
 
     @property
     def name(self) -> str:
-        name_str = ""
-        if self.name_prefix is not None:
-            name_str += f" {self.name_prefix}"
-        if self.given_name is not None:
-            name_str += f" {self.given_name}"
-        if self.additional_name is not None:
-            name_str += f" {self.additional_name}"
-        if self.family_name is not None:
-            name_str += f" {self.family_name}"
-        if self.name_suffix is not None:
-            name_str += f" {self.name_suffix}"
-        return name_str
+        return " ".join(
+            part
+            for part in (
+                self.name_prefix,
+                self.given_name,
+                self.additional_name,
+                self.family_name,
+                self.name_suffix,
+            )
+            if part is not None
+        )
 
     @property
     def yomi_name(self) -> str:
-        yomi_name_str = ""
-        if self.given_name_yomi is not None:
-            yomi_name_str += f" {self.given_name_yomi}"
-        if self.additional_name_yomi is not None:
-            yomi_name_str += f" {self.additional_name_yomi}"
-        if self.family_name_yomi is not None:
-            yomi_name_str += f" {self.family_name_yomi}"
-        return yomi_name_str
+        return " ".join(
+            part
+            for part in (
+                self.given_name_yomi,
+                self.additional_name_yomi,
+                self.family_name_yomi,
+            )
+            if part is not None
+        )
 
 
 class GoogleCSV:
     def __init__(self, path: str) -> None:
         self.path = path
+        self._address_cache: Dict[Tuple[Optional[str], ...], Address] = {}
+        self._organization_cache: Dict[Tuple[Optional[str], ...], Organization] = {}
 
     def _get_value(self, column: str, row: List[str]) -> Optional[str]:
-        value = row[self.header.index(column)]
+        idx = self._col_idx.get(column)
+        if idx is None:
+            return None
+        value = row[idx]
         if len(value) == 0:
             return None
         else:
@@ -140,8 +150,7 @@ class GoogleCSV:
 
     @staticmethod
     def _parse_date(date_str: str) -> datetime.date:
-        year, month, day = date_str.split("-")
-        return datetime.date(int(year), int(month), int(day))
+        return datetime.date.fromisoformat(date_str)
 
     def _get_birthday(self, row: List[str]) -> Optional[datetime.date]:
         birthday: Optional[datetime.date] = None
@@ -154,48 +163,95 @@ class GoogleCSV:
         values = self._get_value(column, row)
         if values is None:
             return set()
+        elif _SEP in values:
+            return set(values.split(_SEP))
         else:
-            return set(values.split(" ::: "))
+            return {values}
 
-    def _get_value_map(
-        self, column: str, row: List[str], key: str = "Type", value: str = "Value"
-    ) -> Dict[str, Set[str]]:
-        index: int = 0
-        data: Dict[str, Set[str]] = {}
-        while True:
+    def _get_block_cols(self, prefix: str, fields: List[str]) -> List[Tuple[int, ...]]:
+        blocks = self._block_layout.get(prefix, {})
+        block_cols: List[Tuple[int, ...]] = []
+        index: int = 1
+        while index in blocks and all(field in blocks[index] for field in fields):
+            block_cols.append(tuple(blocks[index][field] for field in fields))
             index += 1
-            try:
-                k = row[self.header.index(f"{column} {index} - {key}")]
-                v = row[self.header.index(f"{column} {index} - {value}")]
-            except ValueError:
-                break
-            else:
-                if k.startswith("* "):
-                    k = k[2:]
-                if len(k) or len(v):
-                    if k not in data:
-                        data[k] = set()
-                    data[k].update(v.split(" ::: "))
+        return block_cols
+
+    def _prepare_schema(self) -> None:
+        self._block_layout: Dict[str, Dict[int, Dict[str, int]]] = {}
+        for idx, name in enumerate(self.header):
+            match = _BLOCK_COLUMN_RE.match(name)
+            if match is None:
+                continue
+            prefix, index, block_field = match.groups()
+            blocks = self._block_layout.setdefault(prefix, {})
+            blocks.setdefault(int(index), {})[block_field] = idx
+        self._map_cols: Dict[str, List[Tuple[int, ...]]] = {
+            column: self._get_block_cols(column, ["Type", "Value"])
+            for column in [
+                "E-mail",
+                "Phone",
+                "Relation",
+                "Website",
+                "Event",
+                "Custom Field",
+            ]
+        }
+        self._im_cols = self._get_block_cols("IM", ["Service", "Value"])
+        self._address_cols = self._get_block_cols(
+            "Address",
+            [
+                "Type",
+                "Street",
+                "City",
+                "PO Box",
+                "Region",
+                "Postal Code",
+                "Country",
+                "Extended Address",
+            ],
+        )
+        self._organization_cols = self._get_block_cols(
+            "Organization",
+            [
+                "Type",
+                "Name",
+                "Yomi Name",
+                "Title",
+                "Department",
+                "Symbol",
+                "Location",
+                "Job Description",
+            ],
+        )
+
+    def _get_value_map(self, column: str, row: List[str]) -> Dict[str, Set[str]]:
+        data: Dict[str, Set[str]] = {}
+        for key_idx, value_idx in self._map_cols[column]:
+            k = row[key_idx]
+            v = row[value_idx]
+            if k.startswith("* "):
+                k = k[2:]
+            k = intern(k)
+            if len(k) or len(v):
+                if _SEP in v:
+                    data.setdefault(k, set()).update(v.split(_SEP))
+                else:
+                    data.setdefault(k, set()).add(v)
         return data
 
     def _get_ims(self, row: List[str]) -> Dict[str, Set[str]]:
-        index: int = 0
         data: Dict[str, Set[str]] = {}
-        while True:
-            index += 1
-            try:
-                k = row[self.header.index(f"IM {index} - Service")]
-                v = row[self.header.index(f"IM {index} - Value")]
-            except ValueError:
-                break
-            else:
-                if len(k) or len(v):
-                    services = k.split(" ::: ")
-                    values = v.split(" ::: ")
-                    for i in range(0, len(services)):
-                        if services[i] not in data:
-                            data[services[i]] = set()
-                        data[services[i]].add(values[i])
+        for service_idx, value_idx in self._im_cols:
+            k = row[service_idx]
+            v = row[value_idx]
+            if len(k) or len(v):
+                services = [intern(service) for service in k.split(_SEP)]
+                values = v.split(_SEP)
+                for i in range(0, len(services)):
+                    if services[i] not in data:
+                        data[services[i]] = set()
+                    data[services[i]].add(values[i])
         return data
 
     def _get_events(self, row: List[str]) -> Dict[str, datetime.date]:
@@ -206,197 +262,195 @@ class GoogleCSV:
         return data
 
     def _get_addresses(self, row: List[str]) -> Dict[str, Set[Address]]:
-        index: int = 0
         data: Dict[str, Set[Address]] = {}
-        while True:
-            index += 1
-            try:
-                address_type = row[self.header.index(f"Address {index} - Type")]
-                address_street = row[self.header.index(f"Address {index} - Street")]
-                address_city = row[self.header.index(f"Address {index} - City")]
-                address_po_box = row[self.header.index(f"Address {index} - PO Box")]
-                address_region = row[self.header.index(f"Address {index} - Region")]
-                address_postal_code = row[
-                    self.header.index(f"Address {index} - Postal Code")
-                ]
-                address_country = row[self.header.index(f"Address {index} - Country")]
-                address_extended_address = row[
-                    self.header.index(f"Address {index} - Extended Address")
-                ]
-            except ValueError:
-                break
-            else:
-                address_street_list = address_street.split(" ::: ")
-                address_city_list = address_city.split(" ::: ")
-                address_po_box_list = address_po_box.split(" ::: ")
-                address_region_list = address_region.split(" ::: ")
-                address_postal_code_list = address_postal_code.split(" ::: ")
-                address_country_list = address_country.split(" ::: ")
-                address_extended_address_list = address_extended_address.split(" ::: ")
-
-                for i in range(0, len(address_street_list)):
-                    if not (
-                        address_street_list[i] != ""
-                        or address_city_list[i] != ""
-                        or address_po_box_list[i] != ""
-                        or address_region_list[i] != ""
-                        or address_postal_code_list[i] != ""
-                        or address_country_list[i] != ""
-                        or address_extended_address_list[i] != ""
-                    ):
-                        continue
-                    if address_type not in data:
-                        data[address_type] = set()
-                    data[address_type].add(
-                        Address(
-                            street=address_street_list[i]
-                            if address_street_list[i] != ""
-                            else None,
-                            city=address_city_list[i]
-                            if address_city_list[i] != ""
-                            else None,
-                            po_box=address_po_box_list[i]
-                            if address_po_box_list[i] != ""
-                            else None,
-                            region=address_region_list[i]
-                            if address_region_list[i] != ""
-                            else None,
-                            postal_code=address_postal_code_list[i]
-                            if address_postal_code_list[i] != ""
-                            else None,
-                            country=address_country_list[i]
-                            if address_country_list[i] != ""
-                            else None,
-                            extended_address=address_extended_address_list[i]
-                            if address_extended_address_list[i] != ""
-                            else None,
-                        )
-                    )
+        address_cache = self._address_cache
+        for (
+            type_idx,
+            street_idx,
+            city_idx,
+            po_box_idx,
+            region_idx,
+            postal_code_idx,
+            country_idx,
+            extended_address_idx,
+        ) in self._address_cols:
+            address_type = intern(row[type_idx])
+            for (
+                street,
+                city,
+                po_box,
+                region,
+                postal_code,
+                country,
+                extended_address,
+            ) in zip(
+                row[street_idx].split(_SEP),
+                row[city_idx].split(_SEP),
+                row[po_box_idx].split(_SEP),
+                row[region_idx].split(_SEP),
+                row[postal_code_idx].split(_SEP),
+                row[country_idx].split(_SEP),
+                row[extended_address_idx].split(_SEP),
+            ):
+                if not (
+                    street
+                    or city
+                    or po_box
+                    or region
+                    or postal_code
+                    or country
+                    or extended_address
+                ):
+                    continue
+                address_key = (
+                    street or None,
+                    city or None,
+                    po_box or None,
+                    region or None,
+                    postal_code or None,
+                    country or None,
+                    extended_address or None,
+                )
+                address = address_cache.get(address_key)
+                if address is None:
+                    address = Address(*address_key)
+                    address_cache[address_key] = address
+                if address_type not in data:
+                    data[address_type] = set()
+                data[address_type].add(address)
         return data
 
     def _get_organizations(self, row: List[str]) -> Dict[str, Set[Organization]]:
-        index: int = 0
         data: Dict[str, Set[Organization]] = {}
-        while True:
-            index += 1
-            try:
-                organization_type = row[
-                    self.header.index(f"Organization {index} - Type")
-                ]
-                organization_name = row[
-                    self.header.index(f"Organization {index} - Name")
-                ]
-                organization_yomi_name = row[
-                    self.header.index(f"Organization {index} - Yomi Name")
-                ]
-                organization_title = row[
-                    self.header.index(f"Organization {index} - Title")
-                ]
-                organization_department = row[
-                    self.header.index(f"Organization {index} - Department")
-                ]
-                organization_symbol = row[
-                    self.header.index(f"Organization {index} - Symbol")
-                ]
-                organization_location = row[
-                    self.header.index(f"Organization {index} - Location")
-                ]
-                organization_job_description = row[
-                    self.header.index(f"Organization {index} - Job Description")
-                ]
-            except ValueError:
-                break
-            else:
-                organization_name_list = organization_name.split(" ::: ")
-                organization_yomi_name_list = organization_yomi_name.split(" ::: ")
-                organization_title_list = organization_title.split(" ::: ")
-                organization_department_list = organization_department.split(" ::: ")
-                organization_symbol_list = organization_symbol.split(" ::: ")
-                organization_location_list = organization_location.split(" ::: ")
-                organization_job_description_list = organization_job_description.split(
-                    " ::: "
+        organization_cache = self._organization_cache
+        for (
+            type_idx,
+            name_idx,
+            yomi_name_idx,
+            title_idx,
+            department_idx,
+            symbol_idx,
+            location_idx,
+            job_description_idx,
+        ) in self._organization_cols:
+            organization_type = intern(row[type_idx])
+            for (
+                name,
+                yomi_name,
+                title,
+                department,
+                symbol,
+                location,
+                job_description,
+            ) in zip(
+                row[name_idx].split(_SEP),
+                row[yomi_name_idx].split(_SEP),
+                row[title_idx].split(_SEP),
+                row[department_idx].split(_SEP),
+                row[symbol_idx].split(_SEP),
+                row[location_idx].split(_SEP),
+                row[job_description_idx].split(_SEP),
+            ):
+                if not (
+                    name
+                    or yomi_name
+                    or title
+                    or department
+                    or symbol
+                    or location
+                    or job_description
+                ):
+                    continue
+                organization_key = (
+                    name or None,
+                    yomi_name or None,
+                    title or None,
+                    department or None,
+                    symbol or None,
+                    location or None,
+                    job_description or None,
                 )
-
-                for i in range(0, len(organization_name_list)):
-                    if not (
-                        organization_name_list[i] != ""
-                        or organization_yomi_name_list[i] != ""
-                        or organization_title_list[i] != ""
-                        or organization_department_list[i] != ""
-                        or organization_symbol_list[i] != ""
-                        or organization_location_list[i] != ""
-                        or organization_job_description_list[i] != ""
-                    ):
-                        continue
-                    if organization_type not in data:
-                        data[organization_type] = set()
-                    data[organization_type].add(
-                        Organization(
-                            name=organization_name_list[i]
-                            if organization_name_list[i] != ""
-                            else None,
-                            yomi_name=organization_yomi_name_list[i]
-                            if organization_yomi_name_list[i] != ""
-                            else None,
-                            title=organization_title_list[i]
-                            if organization_title_list[i] != ""
-                            else None,
-                            department=organization_department_list[i]
-                            if organization_department_list[i] != ""
-                            else None,
-                            symbol=organization_symbol_list[i]
-                            if organization_symbol_list[i] != ""
-                            else None,
-                            location=organization_location_list[i]
-                            if organization_location_list[i] != ""
-                            else None,
-                            job_description=organization_job_description_list[i]
-                            if organization_job_description_list[i] != ""
-                            else None,
-                        )
-                    )
+                organization = organization_cache.get(organization_key)
+                if organization is None:
+                    organization = Organization(*organization_key)
+                    organization_cache[organization_key] = organization
+                if organization_type not in data:
+                    data[organization_type] = set()
+                data[organization_type].add(organization)
         return data
 
+    @staticmethod
+    def parse_many(
+        paths: List[str], max_workers: Optional[int] = None
+    ) -> Iterator[Contact]:
+        """
+        Parse several files in parallel worker processes. Contacts of each file are
+        yielded as soon as that file is parsed, so the order across files is not
+        deterministic.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_parse_path, path) for path in paths]
+            for future in as_completed(futures):
+                yield from future.result()
+
     def parse(self) -> Iterator[Contact]:
-        with open(self.path) as csvfile:
+        with open(
+            self.path, newline="", buffering=_CSV_BUFFER_SIZE, encoding="utf-8"
+        ) as csvfile:
             csv_reader = csv.reader(csvfile)
             self.header = next(csv_reader)
+            self._col_idx: Dict[str, int] = {
+                name: idx for idx, name in enumerate(self.header)
+            }
+            self._prepare_schema()
+            get_value = self._get_value
+            get_value_set = self._get_value_set
+            get_value_map = self._get_value_map
+            get_birthday = self._get_birthday
+            get_ims = self._get_ims
+            get_addresses = self._get_addresses
+            get_organizations = self._get_organizations
+            get_events = self._get_events
             for row in csv_reader:
                 yield Contact(
-                    given_name=self._get_value("Given Name", row),
-                    additional_name=self._get_value("Additional Name", row),
-                    family_name=self._get_value("Family Name", row),
-                    given_name_yomi=self._get_value("Given Name Yomi", row),
-                    additional_name_yomi=self._get_value("Additional Name Yomi", row),
-                    family_name_yomi=self._get_value("Family Name Yomi", row),
-                    name_prefix=self._get_value("Name Prefix", row),
-                    name_suffix=self._get_value("Name Suffix", row),
-                    initials=self._get_value("Initials", row),
-                    nickname=self._get_value("Nickname", row),
-                    short_name=self._get_value("Short Name", row),
-                    maiden_name=self._get_value("Maiden Name", row),
-                    birthday=self._get_birthday(row),
-                    gender=self._get_value("Gender", row),
-                    location=self._get_value("Location", row),
-                    billing_information=self._get_value("Billing Information", row),
-                    directory_server=self._get_value("Directory Server", row),
-                    mileage=self._get_value("Mileage", row),
-                    occupation=self._get_value("Occupation", row),
-                    hobby=self._get_value("Hobby", row),
-                    sensitivity=self._get_value("Sensitivity", row),
-                    priority=self._get_value("Priority", row),
-                    subject=self._get_value("Subject", row),
-                    notes=self._get_value("Notes", row),
-                    language=self._get_value("Language", row),
-                    photo=self._get_value("Photo", row),
-                    group_membership=self._get_value_set("Group Membership", row),
-                    emails=self._get_value_map("E-mail", row),
-                    ims=self._get_ims(row),
-                    phones=self._get_value_map("Phone", row),
-                    addresses=self._get_addresses(row),
-                    organizations=self._get_organizations(row),
-                    relations=self._get_value_map("Relation", row),
-                    websites=self._get_value_map("Website", row),
-                    events=self._get_events(row),
-                    custom_fields=self._get_value_map("Custom Field", row),
+                    get_value("Given Name", row),
+                    get_value("Additional Name", row),
+                    get_value("Family Name", row),
+                    get_value("Given Name Yomi", row),
+                    get_value("Additional Name Yomi", row),
+                    get_value("Family Name Yomi", row),
+                    get_value("Name Prefix", row),
+                    get_value("Name Suffix", row),
+                    get_value("Initials", row),
+                    get_value("Nickname", row),
+                    get_value("Short Name", row),
+                    get_value("Maiden Name", row),
+                    get_birthday(row),
+                    get_value("Gender", row),
+                    get_value("Location", row),
+                    get_value("Billing Information", row),
+                    get_value("Directory Server", row),
+                    get_value("Mileage", row),
+                    get_value("Occupation", row),
+                    get_value("Hobby", row),
+                    get_value("Sensitivity", row),
+                    get_value("Priority", row),
+                    get_value("Subject", row),
+                    get_value("Notes", row),
+                    get_value("Language", row),
+                    get_value("Photo", row),
+                    get_value_set("Group Membership", row),
+                    get_value_map("E-mail", row),
+                    get_ims(row),
+                    get_value_map("Phone", row),
+                    get_addresses(row),
+                    get_organizations(row),
+                    get_value_map("Relation", row),
+                    get_value_map("Website", row),
+                    get_events(row),
+                    get_value_map("Custom Field", row),
                 )
+
+
+def _parse_path(path: str) -> List[Contact]:
+    return list(GoogleCSV(path).parse())
@@ -1,18 +1,23 @@
-from typing import Dict, List, Optional, Tuple, Union, cast
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import sigrokdecode
 
 from . import frame as frame_mod
 from . import record as record_mod
 
-
-def _get_annotation_index(annotations: Tuple[Tuple[str, str], ...], name: str) -> int:
-    for index, annotation in enumerate(annotations):
-        if annotation[0] == name:
-            return index
-    raise RuntimeError(f"Unknown annotation {repr(name)}: {repr(annotations)}")
-
-
 _FRAME_TYPE_DESC: Dict[str, str] = {
     frame_class.get_kebab_case_description(): frame_class.DESCRIPTION
     for frame_class in frame_mod.Frame.SUBCLASSES + [frame_mod.Frame]
@@ -38,6 +43,110 @@ _ANNOTATIONS = (
     ("receiver-warning", "Receiver Warning"),
 )
 
+_ANNOTATION_INDEX: Dict[str, int] = {
+    name: index for index, (name, _desc) in enumerate(_ANNOTATIONS)
+}
+
+_IDX_SYNC = _ANNOTATION_INDEX["sync"]
+_IDX_FRAME_START = _ANNOTATION_INDEX["frame-start"]
+_IDX_FRAME_HEADER = _ANNOTATION_INDEX["frame-header"]
+_IDX_SENDER_WARNING = _ANNOTATION_INDEX["sender-warning"]
+_IDX_RECEIVER_XON = _ANNOTATION_INDEX["receiver-xon"]
+_IDX_RECEIVER_XOFF = _ANNOTATION_INDEX["receiver-xoff"]
+_IDX_RECEIVER_ACK = _ANNOTATION_INDEX["receiver-ack"]
+_IDX_RECEIVER_NACK = _ANNOTATION_INDEX["receiver-nack"]
+_IDX_RECEIVER_WARNING = _ANNOTATION_INDEX["receiver-warning"]
+
+_UartData = Tuple[str, int, Tuple[int, List[int]]]
+
+_SYNC_CR = 0x0D
+_SYNC_LF = 0x0A
+_FRAME_START = 0x3A
+
+# ASCII hex digit to nibble value, 0xFF for anything else
+_HEX_LUT = bytes(
+    int(chr(value), 16) if chr(value) in "0123456789abcdefABCDEF" else 0xFF
+    for value in range(256)
+)
+
+_HEX_STR: Tuple[str, ...] = tuple(hex(value) for value in range(256))
+
+# Annotation prefix for every chunk description FrameBuilder.add_data returns
+_CHUNK_PREFIX: Mapping[str, str] = MappingProxyType(
+    {
+        chunk_desc: f"{chunk_desc}: "
+        for chunk_desc in (
+            "Length",
+            "Type",
+            "Address Low",
+            "Address High",
+            "Data",
+            "Checksum",
+        )
+    }
+)
+
+# Same escapes as repr() for every character frames can render
+_ESCAPE_TABLE: Dict[int, str] = {
+    value: repr(chr(value))[1:-1]
+    for value in range(256)
+    if not chr(value).isprintable() or chr(value) == "\\"
+}
+
+
+def _escape(text: str) -> str:
+    text = text.translate(_ESCAPE_TABLE)
+    if "'" in text and '"' in text:
+        text = text.replace("'", "\\'")
+    return text
+
+
+_STATE_SYNC_OR_FRAME = 0
+_STATE_SYNC = 1
+_STATE_FRAME = 2
+
+_RECORD_STATE_DIRECTORY_OR_RECORD = 0
+_RECORD_STATE_START = 1
+_RECORD_STATE_FRAMES = 2
+
+# Static annotations: put() only reads them, so they can be shared across calls
+_ANN_SYNC_1: List[Any] = [_IDX_SYNC, ["Sync 1/2"]]
+_ANN_SYNC_2: List[Any] = [_IDX_SYNC, ["Sync 2/2"]]
+_ANN_FRAME_START: List[Any] = [_IDX_FRAME_START, ["Frame Start"]]
+_ANN_SENDER_UNKNOWN: List[Any] = [_IDX_SENDER_WARNING, ["?"]]
+_ANN_BAD_CHECKSUM: List[Any] = [_IDX_SENDER_WARNING, ["Bad Checksum"]]
+_ANN_RECEIVER_UNKNOWN: List[Any] = [_IDX_RECEIVER_WARNING, ["?"]]
+
+_RECEIVER_TABLE: Dict[int, List[Any]] = {
+    0x11: [_IDX_RECEIVER_XON, ["XON"]],
+    0x13: [_IDX_RECEIVER_XOFF, ["XOFF"]],
+    0x23: [_IDX_RECEIVER_ACK, ["Ack"]],
+    0x3F: [_IDX_RECEIVER_NACK, ["NACK"]],
+}
+
+_FRAME_TYPE_IDX: Dict[str, int] = {
+    id_str: _ANNOTATION_INDEX[f"frame-type-{id_str}"] for id_str in _FRAME_TYPE_DESC
+}
+
+_DIRECTORY_TO_RECORD = record_mod.Record.DIRECTORY_TO_RECORD
+
+# Exact type sets, so per frame checks avoid isinstance() MRO walks
+_DIRECTORY_TYPES: FrozenSet[Type[frame_mod.Directory]] = frozenset(
+    frame_class
+    for frame_class in frame_mod.Frame.SUBCLASSES
+    if issubclass(frame_class, frame_mod.Directory)
+)
+_END_OF_RECORD_TYPES: FrozenSet[Type[frame_mod.Frame]] = frozenset(
+    frame_class
+    for frame_class in frame_mod.Frame.SUBCLASSES
+    if issubclass(frame_class, frame_mod.EndOfRecord)
+)
+
+_RECORD_IDX: Dict[Type[record_mod.Record], int] = {
+    record_class: _ANNOTATION_INDEX[f"sender-record-{record_class.__name__.lower()}"]
+    for record_class in _DIRECTORY_TO_RECORD.values()
+}
+
 
 class Decoder(sigrokdecode.Decoder):
     api_version = 3
@@ -68,18 +177,18 @@ class Decoder(sigrokdecode.Decoder):
             "sender",
             "Sender",
             (
-                _get_annotation_index(annotations, "sync"),
-                _get_annotation_index(annotations, "frame-start"),
-                _get_annotation_index(annotations, "frame-header"),
-                _get_annotation_index(annotations, "frame-data"),
-                _get_annotation_index(annotations, "frame-checksum"),
+                _ANNOTATION_INDEX["sync"],
+                _ANNOTATION_INDEX["frame-start"],
+                _ANNOTATION_INDEX["frame-header"],
+                _ANNOTATION_INDEX["frame-data"],
+                _ANNOTATION_INDEX["frame-checksum"],
             ),
         ),
         (
             "frame",
             "Frame",
             tuple(
-                _get_annotation_index(_ANNOTATIONS, f"frame-type-{id_str}")
+                _ANNOTATION_INDEX[f"frame-type-{id_str}"]
                 for id_str in _FRAME_TYPE_DESC.keys()
             ),
         ),
@@ -87,40 +196,47 @@ class Decoder(sigrokdecode.Decoder):
             "record",
             "Record",
             tuple(
-                _get_annotation_index(
-                    _ANNOTATIONS, f"sender-record-{record_class.__name__.lower()}"
-                )
+                _ANNOTATION_INDEX[f"sender-record-{record_class.__name__.lower()}"]
                 for record_class in record_mod.Record.DIRECTORY_TO_RECORD.values()
             )
-            + (_get_annotation_index(_ANNOTATIONS, "sender-record-unknown"),),
+            + (_ANNOTATION_INDEX["sender-record-unknown"],),
         ),
         (
             "sender-warning",
             "Sender Warning",
-            (_get_annotation_index(annotations, "sender-warning"),),
+            (_ANNOTATION_INDEX["sender-warning"],),
         ),
         (
             "receiver",
             "Receiver",
             (
-                _get_annotation_index(annotations, "receiver-xon"),
-                _get_annotation_index(annotations, "receiver-xoff"),
-                _get_annotation_index(annotations, "receiver-ack"),
-                _get_annotation_index(annotations, "receiver-nack"),
+                _ANNOTATION_INDEX["receiver-xon"],
+                _ANNOTATION_INDEX["receiver-xoff"],
+                _ANNOTATION_INDEX["receiver-ack"],
+                _ANNOTATION_INDEX["receiver-nack"],
             ),
         ),
         (
             "receiver-warning",
             "Receiver Warning",
-            (_get_annotation_index(annotations, "receiver-warning"),),
+            (_ANNOTATION_INDEX["receiver-warning"],),
         ),
     )
     binary: Tuple[Tuple[str, str], ...] = tuple()
     tags = ["PC"]
 
-    _record_state: str
+    _sender_state: int
+    _hex_high: int
+    _record_state: int
+    _record_directory_type: Type[frame_mod.Directory]
+    _record_frames: List[frame_mod.Frame]
+    _record_startsample: int
     _frame_builder: frame_mod.FrameBuilder
+    _frame_sum: int
+    _frame_startsample: int
     _chunk_startsample: int
+    _put: Callable[..., None]
+    _sender_rxtx: int
 
     ##
     ## Private
@@ -129,62 +245,11 @@ class Decoder(sigrokdecode.Decoder):
     # Receiver
 
     def _decode_receiver(self, startsample: int, endsample: int, data: int) -> None:
-        if data == 0x11:
-            self.put(
-                startsample,
-                endsample,
-                self.out_ann,
-                [
-                    _get_annotation_index(self.annotations, "receiver-xon"),
-                    ["XON"],
-                ],
-            )
-            return
-
-        if data == 0x13:
-            self.put(
-                startsample,
-                endsample,
-                self.out_ann,
-                [
-                    _get_annotation_index(self.annotations, "receiver-xoff"),
-                    ["XOFF"],
-                ],
-            )
-            return
-
-        if data == 0x23:
-            self.put(
-                startsample,
-                endsample,
-                self.out_ann,
-                [
-                    _get_annotation_index(self.annotations, "receiver-ack"),
-                    ["Ack"],
-                ],
-            )
-            return
-
-        if data == 0x3F:
-            self.put(
-                startsample,
-                endsample,
-                self.out_ann,
-                [
-                    _get_annotation_index(self.annotations, "receiver-nack"),
-                    ["NACK"],
-                ],
-            )
-            return
-
-        self.put(
+        self._put(
             startsample,
             endsample,
             self.out_ann,
-            [
-                _get_annotation_index(self.annotations, "receiver-warning"),
-                ["?"],
-            ],
+            _RECEIVER_TABLE.get(data, _ANN_RECEIVER_UNKNOWN),
         )
 
     # Sender
@@ -193,92 +258,81 @@ class Decoder(sigrokdecode.Decoder):
         self, startsample: int, endsample: int, data: int
     ) -> bool:
         # Sync 1/2
-        if data == ord("\r"):
-            self.put(
+        if data == _SYNC_CR:
+            self._put(
                 startsample,
                 endsample,
                 self.out_ann,
-                [
-                    _get_annotation_index(self.annotations, "sync"),
-                    ["Sync 1/2"],
-                ],
+                _ANN_SYNC_1,
             )
-            self._sender_decode_function = self._decode_sender_sync
+            self._sender_state = _STATE_SYNC
             return True
         # Frame start
-        if data == ord(":"):
+        if data == _FRAME_START:
             self._frame_startsample = startsample
-            self.put(
+            self._put(
                 startsample,
                 endsample,
                 self.out_ann,
-                [
-                    _get_annotation_index(self.annotations, "frame-start"),
-                    ["Frame Start"],
-                ],
+                _ANN_FRAME_START,
             )
-            self._sender_decode_function = self._decode_sender_frame
+            self._sender_state = _STATE_FRAME
             return True
         return False
 
     def _decode_sender_sync(self, startsample: int, endsample: int, data: int) -> bool:
-        if data is ord("\n"):
-            self.put(
+        if data == _SYNC_LF:
+            self._put(
                 startsample,
                 endsample,
                 self.out_ann,
-                [
-                    _get_annotation_index(self.annotations, "sync"),
-                    ["Sync 2/2"],
-                ],
+                _ANN_SYNC_2,
             )
-            self._sender_decode_function = self._decode_sender_sync_or_frame
+            self._sender_state = _STATE_SYNC_OR_FRAME
             return True
         return False
 
     def _decode_hex(self, data: int) -> Optional[int]:
-        if not hasattr(self, "_hex_high_value"):
-            self._hex_high_value = chr(data)
+        if self._hex_high < 0:
+            self._hex_high = data
             return None
-        else:
-            hex_value = int(self._hex_high_value + chr(data), 16)
-            delattr(self, "_hex_high_value")
-            return hex_value
+        high = _HEX_LUT[self._hex_high]
+        low = _HEX_LUT[data]
+        if (high | low) > 0xF:
+            raise ValueError(
+                f"Invalid hex digits: {repr(chr(self._hex_high) + chr(data))}"
+            )
+        self._hex_high = -1
+        return (high << 4) | low
 
     def _decode_record(
         self, startsample: int, endsample: int, decoded_frame: frame_mod.Frame
     ) -> None:
-        if self._record_state == "directory_or_record":
-            if isinstance(decoded_frame, frame_mod.Directory):
-                self._record_state = "start"
-                self._record_directory_type = type(decoded_frame)
+        if self._record_state == _RECORD_STATE_DIRECTORY_OR_RECORD:
+            if type(decoded_frame) in _DIRECTORY_TYPES:
+                self._record_state = _RECORD_STATE_START
+                self._record_directory_type = cast(
+                    Type[frame_mod.Directory], type(decoded_frame)
+                )
                 return
             else:
-                self._record_state = "start"
-        if self._record_state == "start":
+                self._record_state = _RECORD_STATE_START
+        if self._record_state == _RECORD_STATE_START:
             self._record_startsample = startsample
-            self._record_state = "frames"
-            self._record_frames: List[frame_mod.Frame] = []
-        if self._record_state == "frames":
-            if isinstance(decoded_frame, frame_mod.EndOfRecord):
-                if self._record_directory_type in record_mod.Record.DIRECTORY_TO_RECORD:
-                    record_class = record_mod.Record.DIRECTORY_TO_RECORD[
-                        self._record_directory_type
-                    ]
+            self._record_state = _RECORD_STATE_FRAMES
+            self._record_frames = []
+        if self._record_state == _RECORD_STATE_FRAMES:
+            if type(decoded_frame) in _END_OF_RECORD_TYPES:
+                record_class = _DIRECTORY_TO_RECORD.get(self._record_directory_type)
+                if record_class is not None:
                     decoded_record = record_class.from_frames(self._record_frames)
                     decoded_str = str(decoded_record)
-                    annotation = (
-                        f"sender-record-{type(decoded_record).__name__.lower()}"
-                    )
-                    self.put(
+                    self._put(
                         self._record_startsample,
                         endsample,
                         self.out_ann,
                         [
-                            _get_annotation_index(
-                                self.annotations,
-                                annotation,
-                            ),
+                            _RECORD_IDX[type(decoded_record)],
                             [decoded_str],
                         ],
                     )
@@ -286,91 +340,72 @@ class Decoder(sigrokdecode.Decoder):
                     decoded_str = "Unknown Record: " + ", ".join(
                         str(f) for f in self._record_frames
                     )
-                    annotation = "sender-record-unknown"
-                    self.put(
+                    self._put(
                         self._record_startsample,
                         endsample,
                         self.out_ann,
                         [
-                            _get_annotation_index(self.annotations, "sender-warning"),
+                            _IDX_SENDER_WARNING,
                             [decoded_str],
                         ],
                     )
-                self._record_state = "directory_or_record"
+                self._record_state = _RECORD_STATE_DIRECTORY_OR_RECORD
             else:
                 self._record_frames.append(decoded_frame)
 
     def _decode_sender_frame(self, startsample: int, endsample: int, data: int) -> bool:
         value = self._decode_hex(data)
         if value is not None:
+            put = self._put
+            out_ann = self.out_ann
+            self._frame_sum += value
             (chunk_desc, decoded_frame) = self._frame_builder.add_data(value)
-            self.put(
+            put(
                 self._chunk_startsample,
                 endsample,
-                self.out_ann,
+                out_ann,
                 [
-                    _get_annotation_index(self.annotations, "frame-header"),
-                    [f"{chunk_desc}: " + hex(value)],
+                    _IDX_FRAME_HEADER,
+                    [_CHUNK_PREFIX[chunk_desc] + _HEX_STR[value]],
                 ],
             )
             if decoded_frame is not None:
-                if not decoded_frame.is_checksum_valid():
-                    self.put(
+                # Length, type, address, data and checksum add up to 0 when valid
+                if self._frame_sum & 0xFF:
+                    put(
                         self._chunk_startsample,
                         endsample,
-                        self.out_ann,
-                        [
-                            _get_annotation_index(self.annotations, "sender-warning"),
-                            ["Bad Checksum"],
-                        ],
+                        out_ann,
+                        _ANN_BAD_CHECKSUM,
                     )
                 if type(decoded_frame) is frame_mod.Frame:
-                    self.put(
+                    put(
                         self._frame_startsample,
                         endsample,
-                        self.out_ann,
+                        out_ann,
                         [
-                            _get_annotation_index(self.annotations, "sender-warning"),
+                            _IDX_SENDER_WARNING,
                             [f"Unknown {decoded_frame}"],
                         ],
                     )
                 else:
-                    self.put(
+                    put(
                         self._frame_startsample,
                         endsample,
-                        self.out_ann,
+                        out_ann,
                         [
-                            _get_annotation_index(
-                                self.annotations,
-                                f"frame-type-{decoded_frame.get_kebab_case_description()}",
-                            ),
-                            [repr(str(decoded_frame))[1:-1]],
+                            _FRAME_TYPE_IDX[decoded_frame.get_kebab_case_description()],
+                            [_escape(str(decoded_frame))],
                         ],
                     )
                 self._decode_record(self._frame_startsample, endsample, decoded_frame)
                 self._frame_builder = frame_mod.FrameBuilder()
-                self._sender_decode_function = self._decode_sender_sync_or_frame
+                self._frame_sum = 0
+                self._sender_state = _STATE_SYNC_OR_FRAME
         else:
             self._chunk_startsample = startsample
         return True
 
-    def _decode_sender(self, startsample: int, endsample: int, data: int) -> None:
-
-        if self._sender_decode_function(startsample, endsample, data):
-            return
-
-        # Warning
-        self.put(
-            startsample,
-            endsample,
-            self.out_ann,
-            [
-                _get_annotation_index(self.annotations, "sender-warning"),
-                ["?"],
-            ],
-        )
-        self._sender_decode_function = self._decode_sender_sync_or_frame
-
     ##
     ## Public
     ##
@@ -385,6 +420,9 @@ class Decoder(sigrokdecode.Decoder):
          validity, and so on.
         """
         self.out_ann = self.register(sigrokdecode.OUTPUT_ANN)
+        self._put = self.put
+        self.options = cast(Dict[str, str], self.options)
+        self._sender_rxtx = 0 if self.options["sender"] == "RX" else 1
 
     def reset(self) -> None:
         """
@@ -392,9 +430,17 @@ class Decoder(sigrokdecode.Decoder):
         place to reset variables internal to your protocol decoder to their initial
         state, such as state machines and counters.
         """
-        self._sender_decode_function = self._decode_sender_sync_or_frame
+        # Every per-byte attribute is set here, so instances share one dict layout
+        self._sender_state = _STATE_SYNC_OR_FRAME
+        self._hex_high = -1
+        self._record_state = _RECORD_STATE_DIRECTORY_OR_RECORD
+        self._record_directory_type = frame_mod.Directory
+        self._record_frames = []
+        self._record_startsample = 0
         self._frame_builder = frame_mod.FrameBuilder()
-        self._record_state = "directory_or_record"
+        self._frame_sum = 0
+        self._frame_startsample = 0
+        self._chunk_startsample = 0
 
     def decode(
         self,
@@ -412,23 +458,36 @@ class Decoder(sigrokdecode.Decoder):
         decoder to handle.
         """
 
-        self.options = cast(Dict[str, str], self.options)
+        # Other packet types carry a differently shaped payload
+        if data[0] != "DATA":
+            return
 
-        ptype, rxtx, pdata = data
-        pdata = cast(Tuple[int, List[int]], pdata)
+        _ptype, rxtx, (datavalue, _databits) = cast(_UartData, data)
 
-        if ptype != "DATA":
+        if rxtx != self._sender_rxtx:
+            self._decode_receiver(startsample, endsample, datavalue)
             return
 
-        datavalue = pdata[0]
+        # Sender state handlers are called directly, saving a call per byte
+        if _SENDER_HANDLERS[self._sender_state](
+            self, startsample, endsample, datavalue
+        ):
+            return
 
-        if rxtx == 0:
-            if self.options["sender"] == "RX":
-                self._decode_sender(startsample, endsample, datavalue)
-            else:
-                self._decode_receiver(startsample, endsample, datavalue)
-        elif rxtx == 1:
-            if self.options["sender"] == "TX":
-                self._decode_sender(startsample, endsample, datavalue)
-            else:
-                self._decode_receiver(startsample, endsample, datavalue)
+        # Warning
+        self._put(
+            startsample,
+            endsample,
+            self.out_ann,
+            _ANN_SENDER_UNKNOWN,
+        )
+        self._sender_state = _STATE_SYNC_OR_FRAME
+
+
+# Indexed by sender state; kept at module level so per-byte dispatch does not
+# go through the instance and class attribute lookup
+_SENDER_HANDLERS: Tuple[Callable[[Decoder, int, int, int], bool], ...] = (
+    Decoder._decode_sender_sync_or_frame,
+    Decoder._decode_sender_sync,
+    Decoder._decode_sender_frame,
+)
@@ -3,14 +3,32 @@ import textwrap
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+_HEX_TABLE: Tuple[bytes, ...] = tuple(b"%02X" % value for value in range(256))
+
+_BYTE_TO_STR: Tuple[str, ...] = tuple(
+    chr(value) if chr(value).isprintable() else f"[{hex(value)}]"
+    for value in range(256)
+)
 
 ##
 ## Frame
 ##
 
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
     length: int
     frame_type: int
@@ -22,6 +40,22 @@ class Frame:
 
     SUBCLASSES: ClassVar[List[Type["Frame"]]] = []
 
+    # from_data() dispatch per match header: subclasses that also require fixed
+    # data, by data, then the match() candidates, most recently defined first
+    _HEADER_DISPATCH: ClassVar[
+        Dict[
+            Tuple[int, int, int],
+            Tuple[Dict[Tuple[int, ...], Type["Frame"]], Tuple[Type["Frame"], ...]],
+        ]
+    ] = {}
+    # from_data() dispatch for headers no subclass requires
+    _ANY_HEADER_DISPATCH: ClassVar[
+        Tuple[Dict[Tuple[int, ...], Type["Frame"]], Tuple[Type["Frame"], ...]]
+    ] = ({}, ())
+
+    # LENGTH, TYPE and ADDRESS byte sum of subclasses that define all three
+    _HEADER_SUM: ClassVar[Optional[int]] = None
+
     _FRAME_START: int = 0x3A
 
     @classmethod
@@ -29,39 +63,107 @@ class Frame:
         return cls.DESCRIPTION.lower().replace(" ", "-")
 
     def __init_subclass__(cls) -> None:
-        super().__init_subclass__()
+        super(Frame, cls).__init_subclass__()
         cls.SUBCLASSES.append(cls)
+        length = getattr(cls, "LENGTH", None)
+        frame_type = getattr(cls, "TYPE", None)
+        address = getattr(cls, "ADDRESS", None)
+        if length is not None and frame_type is not None and address is not None:
+            cls._HEADER_SUM = (
+                length + frame_type + ((address >> 8) & 0xFF) + (address & 0xFF)
+            )
+        cls._add_dispatch()
+
+    # The (length, frame_type, address) match() requires, or None when match() may
+    # accept other headers
+    @classmethod
+    def _get_match_header(cls) -> Optional[Tuple[int, int, int]]:
+        length = getattr(cls, "LENGTH", None)
+        frame_type = getattr(cls, "TYPE", None)
+        address = getattr(cls, "ADDRESS", None)
+        if length is None or frame_type is None or address is None:
+            return None
+        return (length, frame_type, address)
+
+    # The data match() requires on top of its header, or None when match() accepts
+    # other data
+    @classmethod
+    def _get_match_data(cls) -> Optional[Tuple[int, ...]]:
+        return None
+
+    # Add this class to the from_data() dispatch tables, ahead of the previously
+    # defined subclasses
+    @classmethod
+    def _add_dispatch(cls) -> None:
+        header = cls._get_match_header()
+        if header is None:
+            any_data_to_subclass, any_subclasses = Frame._ANY_HEADER_DISPATCH
+            Frame._ANY_HEADER_DISPATCH = (any_data_to_subclass, (cls,) + any_subclasses)
+            for other_header, (data_to_subclass, subclasses) in list(
+                Frame._HEADER_DISPATCH.items()
+            ):
+                Frame._HEADER_DISPATCH[other_header] = (
+                    data_to_subclass,
+                    (cls,) + subclasses,
+                )
+            return
+        if header in Frame._HEADER_DISPATCH:
+            data_to_subclass, subclasses = Frame._HEADER_DISPATCH[header]
+        else:
+            data_to_subclass, subclasses = {}, Frame._ANY_HEADER_DISPATCH[1]
+        data = cls._get_match_data()
+        if data is None:
+            subclasses = (cls,) + subclasses
+        else:
+            data_to_subclass[data] = cls
+        Frame._HEADER_DISPATCH[header] = (data_to_subclass, subclasses)
+
+    @staticmethod
+    def _check_byte_range(values: Sequence[int]) -> None:
+        # Negative values would silently index the byte tables from the end
+        if values and (min(values) < 0 or max(values) > 0xFF):
+            raise ValueError(f"Byte value out of range: {values}")
 
     def __str__(self) -> str:
-        return "Frame: " + "".join(
-            chr(d) if chr(d).isprintable() else f"[{hex(d)}]" for d in self.data
-        )
+        self._check_byte_range(self.data)
+        byte_to_str = _BYTE_TO_STR
+        return "Frame: " + "".join([byte_to_str[d] for d in self.data])
 
-    def __hash__(self) -> int:
-        return id(self)
+    # Frames hash by identity; object's C implementation avoids a Python call
+    __hash__ = object.__hash__
 
     def __eq__(self, other: Union[Any, "Frame"]) -> bool:
-        if type(other) != type(self):
+        if type(other) is not type(self):
             return False
         return (
-            self.length == other.length
-            and self.frame_type == other.frame_type
-            and self.address == other.address
-            and self.data == other.data
-            and self.checksum == other.checksum
+            self.length,
+            self.frame_type,
+            self.address,
+            self.checksum,
+            self.data,
+        ) == (
+            other.length,
+            other.frame_type,
+            other.address,
+            other.checksum,
+            other.data,
         )
 
     @staticmethod
     def calculate_checksum(
-        length: int, frame_type: int, address: int, data: List[int]
+        length: int, frame_type: int, address: int, data: Sequence[int]
     ) -> int:
-        checksum = (
-            length + frame_type + ((address >> 8) & 0xFF) + (address & 0xFF) + sum(data)
+        total = sum(
+            data, length + frame_type + ((address >> 8) & 0xFF) + (address & 0xFF)
         )
-        checksum &= 0xFF
-        checksum = 0xFF - checksum
-        checksum += 1
-        return checksum & 0xFF
+        # Two's complement of the byte sum, so that all bytes add up to 0
+        return -total & 0xFF
+
+    # calculate_checksum() for this class' LENGTH, TYPE and ADDRESS
+    @classmethod
+    def _calculate_class_checksum(cls, data: Sequence[int]) -> int:
+        assert cls._HEADER_SUM is not None
+        return -sum(data, cls._HEADER_SUM) & 0xFF
 
     def is_checksum_valid(self) -> bool:
         if self.checksum == self.calculate_checksum(
@@ -71,30 +173,35 @@ class Frame:
         else:
             return False
 
-    @staticmethod
-    def _encode(value: int) -> List[int]:
-        assert value <= 255
-        assert value >= 0
-        return list(ord(v) for v in "%02X" % value)
-
     def bytes(self) -> bytes:
-        bytes_list: List[int] = [
-            self._FRAME_START,
-            *self._encode(self.length),
-            *self._encode(self.frame_type),
-            *self._encode(self.address & 0xFF),
-            *self._encode((self.address & 0xFF00) >> 8),
-        ]
-        for d in self.data:
-            bytes_list.extend(self._encode(d))
-        bytes_list.extend(self._encode(self.checksum))
-        return bytes(bytes_list)
+        self._check_byte_range(
+            [self.length, self.frame_type, self.checksum, *self.data]
+        )
+        hex_table = _HEX_TABLE
+        return b"".join(
+            [
+                bytes((self._FRAME_START,)),
+                hex_table[self.length],
+                hex_table[self.frame_type],
+                hex_table[self.address & 0xFF],
+                hex_table[(self.address & 0xFF00) >> 8],
+                b"".join(map(hex_table.__getitem__, self.data)),
+                hex_table[self.checksum],
+            ]
+        )
 
     @classmethod
     def from_data(
         cls, length: int, frame_type: int, address: int, data: List[int], checksum: int
     ) -> "Frame":
-        for subclass in reversed(cls.SUBCLASSES):
+        data_to_subclass, subclasses = cls._HEADER_DISPATCH.get(
+            (length, frame_type, address), cls._ANY_HEADER_DISPATCH
+        )
+        if data_to_subclass:
+            data_subclass = data_to_subclass.get(tuple(data))
+            if data_subclass is not None:
+                return data_subclass(length, frame_type, address, data, checksum)
+        for subclass in subclasses:
             if subclass.match(length, frame_type, address, data):
                 return subclass(length, frame_type, address, data, checksum)
         return cls(length, frame_type, address, data, checksum)
@@ -108,13 +215,14 @@ class Frame:
 
 
 class Directory(Frame):
+    __slots__ = ()
 
     DESCRIPTION: ClassVar[str] = "Directory"
 
     LENGTH: ClassVar[int] = 0x2
     TYPE: ClassVar[int] = 0x0
     ADDRESS: ClassVar[int] = 0x200
-    DATA: ClassVar[List[int]] = [0, 0]
+    DATA: ClassVar[Tuple[int, ...]] = (0, 0)
 
     @classmethod
     def match(cls, length: int, frame_type: int, address: int, data: List[int]) -> bool:
@@ -122,20 +230,24 @@ class Directory(Frame):
             length == cls.LENGTH
             and frame_type == cls.TYPE
             and address == cls.ADDRESS
-            and data == cls.DATA
+            and tuple(data) == cls.DATA
         ):
             return True
         else:
             return False
 
+    @classmethod
+    def _get_match_data(cls) -> Optional[Tuple[int, ...]]:
+        return cls.DATA
+
     @classmethod
     def get(cls) -> "Directory":
         return cls(
             cls.LENGTH,
             cls.TYPE,
             cls.ADDRESS,
-            cls.DATA,
-            cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, cls.DATA),
+            list(cls.DATA),
+            cls._calculate_class_checksum(cls.DATA),
         )
 
     def __str__(self) -> str:
@@ -143,43 +255,59 @@ class Directory(Frame):
 
 
 class TelephoneDirectory(Directory):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Telephone Directory"
-    DATA: ClassVar[List[int]] = [0x90, 0x0]
+    DATA: ClassVar[Tuple[int, ...]] = (0x90, 0x0)
 
 
 class BusinessCardDirectory(Directory):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Business Card Directory"
-    DATA: ClassVar[List[int]] = [0xC0, 0x0]
+    DATA: ClassVar[Tuple[int, ...]] = (0xC0, 0x0)
 
 
 class MemoDirectory(Directory):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Memo Directory"
-    DATA: ClassVar[List[int]] = [0xA0, 0x0]
+    DATA: ClassVar[Tuple[int, ...]] = (0xA0, 0x0)
 
 
 class CalendarDirectory(Directory):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Calendar Directory"
-    DATA: ClassVar[List[int]] = [0x80, 0x0]
+    DATA: ClassVar[Tuple[int, ...]] = (0x80, 0x0)
 
 
 class ScheduleDirectory(Directory):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Schedule Directory"
-    DATA: ClassVar[List[int]] = [0xB0, 0x0]
+    DATA: ClassVar[Tuple[int, ...]] = (0xB0, 0x0)
 
 
 class ReminderDirectory(Directory):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Reminder Directory"
-    DATA: ClassVar[List[int]] = [0x91, 0x0]
+    DATA: ClassVar[Tuple[int, ...]] = (0x91, 0x0)
 
 
 class ToDoDirectory(Directory):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "To Do Directory"
-    DATA: ClassVar[List[int]] = [0xC1, 0x0]
+    DATA: ClassVar[Tuple[int, ...]] = (0xC1, 0x0)
 
 
 class ExpenseManagerDirectory(Directory):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Expense Manager Directory"
-    DATA: ClassVar[List[int]] = [0x92, 0x0]
+    DATA: ClassVar[Tuple[int, ...]] = (0x92, 0x0)
 
 
 # Others
@@ -192,11 +320,13 @@ class Colors(Enum):
 
 
 class Color(Frame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Color"
     LENGTH: ClassVar[int] = 0x1
     TYPE: ClassVar[int] = 0x71
     ADDRESS: ClassVar[int] = 0x0
-    _CODE_TO_COLOR: Dict[int, Colors] = {color.value: color for color in list(Colors)}
+    _CODE_TO_COLOR: Dict[int, Colors] = {color.value: color for color in Colors}
     _COLOR_TO_CODE: Dict[Colors, int] = {
         color: code for code, color in _CODE_TO_COLOR.items()
     }
@@ -217,7 +347,7 @@ class Color(Frame):
             cls.TYPE,
             cls.ADDRESS,
             data,
-            cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, data),
+            cls._calculate_class_checksum(data),
         )
 
     @classmethod
@@ -226,7 +356,7 @@ class Color(Frame):
             length == cls.LENGTH
             and frame_type == cls.TYPE
             and address == cls.ADDRESS
-            and data[0] in cls._CODE_TO_COLOR.keys()
+            and data[0] in cls._CODE_TO_COLOR
         ):
             return True
         return False
@@ -236,6 +366,8 @@ class Color(Frame):
 
 
 class TextDataFrame(ABC, Frame):
+    __slots__ = ()
+
     CASIO_TO_UNICODE: Dict[int, str] = {
         10: chr(0x1F),  # Unit separator
         13: "\n",
@@ -421,6 +553,30 @@ class TextDataFrame(ABC, Frame):
         u: c for c, u in CASIO_TO_UNICODE.items() if u != ""
     }
 
+    # str.translate() table for Latin-1 decoded data, NUL marks unknown codes
+    _CASIO_TRANSLATE: ClassVar[Tuple[str, ...]] = tuple(
+        map(CASIO_TO_UNICODE.get, range(256), "\0" * 256)
+    )
+    # bytes.translate() table for codes that decode to ASCII, 0xFF for the rest
+    _CASIO_ASCII_TRANSLATE: ClassVar[bytes] = bytes(
+        ord(u) if u.isascii() and u != "\0" else 0xFF for u in _CASIO_TRANSLATE
+    )
+    # str.translate() table to CASIO codes as Latin-1 characters, dropping the
+    # Latin-1 characters that have no CASIO code
+    _UNICODE_TRANSLATE: ClassVar[Dict[int, Optional[str]]] = {
+        **dict.fromkeys(range(256)),
+        **{ord(u): chr(c) for u, c in UNICODE_TO_CASIO.items()},
+    }
+
+    @classmethod
+    def _encode_text(cls, text: str) -> List[int]:
+        data = text.translate(cls._UNICODE_TRANSLATE).encode("latin-1", "ignore")
+        if len(data) != len(text):
+            for c in text:
+                if c not in cls.UNICODE_TO_CASIO:
+                    raise ValueError(f"Invalid character: {repr(c)}")
+        return list(data)
+
     @classmethod
     @abstractmethod
     def match(cls, length: int, frame_type: int, address: int, data: List[int]) -> bool:
@@ -428,13 +584,22 @@ class TextDataFrame(ABC, Frame):
 
     @property
     def text(self) -> str:
-        return "".join(self.CASIO_TO_UNICODE[d] for d in self.data)
+        raw = bytes(self.data)
+        ascii_text = raw.translate(self._CASIO_ASCII_TRANSLATE)
+        if ascii_text.isascii():
+            return ascii_text.decode("ascii")
+        text = raw.decode("latin-1").translate(self._CASIO_TRANSLATE)
+        if "\0" in text:
+            raise KeyError(next(d for d in self.data if d not in self.CASIO_TO_UNICODE))
+        return text
 
     def __str__(self) -> str:
         return f"{self.DESCRIPTION}: {self.text}"
 
 
 class Date(TextDataFrame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Date"
     LENGTH: ClassVar[int] = 0xA
     TYPE: ClassVar[int] = 0xF0
@@ -453,47 +618,49 @@ class Date(TextDataFrame):
         day_str = "--"
         if day is not None:
             day_str = "%.2d" % day
-        data: List[int] = [
-            cls.UNICODE_TO_CASIO[c] for c in f"{year_str}-{month_str}-{day_str}"
-        ]
+        data = cls._encode_text(f"{year_str}-{month_str}-{day_str}")
         return cls(
             length=cls.LENGTH,
             frame_type=cls.TYPE,
             address=cls.ADDRESS,
             data=data,
-            checksum=cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, data),
+            checksum=cls._calculate_class_checksum(data),
         )
 
     @classmethod
     def from_date(cls, date: datetime.date) -> "Date":
-        data: List[int] = [
-            cls.UNICODE_TO_CASIO[c]
-            for c in "%.4d-%.2d-%.2d" % (date.year, date.month, date.day)
-        ]
+        data = cls._encode_text("%.4d-%.2d-%.2d" % (date.year, date.month, date.day))
         return cls(
             length=cls.LENGTH,
             frame_type=cls.TYPE,
             address=cls.ADDRESS,
             data=data,
-            checksum=cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, data),
+            checksum=cls._calculate_class_checksum(data),
         )
 
     def _get_date(self) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        raw = bytes(self.data)
+        # Digits and "-" have the same codes in ASCII, so the common case
+        # decodes without going through the CASIO translation
+        if raw.translate(None, b"-0123456789"):
+            text = self.text
+        else:
+            text = raw.decode("ascii")
         year: Optional[int]
         month: Optional[int]
         day: Optional[int]
-        if self.text[0] != "-":
-            year_str = self.text[0:4]
+        if text[0] != "-":
+            year_str = text[0:4]
             year = int(year_str)
         else:
             year = None
-        if self.text[5] != "-":
-            month_str = self.text[5:7]
+        if text[5] != "-":
+            month_str = text[5:7]
             month = int(month_str)
         else:
             month = None
-        if self.text[8] != "-":
-            day_str = self.text[8:10]
+        if text[8] != "-":
+            day_str = text[8:10]
             day = int(day_str)
         else:
             day = None
@@ -533,16 +700,26 @@ class Date(TextDataFrame):
 
 
 class DeadlineDate(Date):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Deadline Date"
+    # Unlike other frames, matches a different type than the one it is built with
+    _MATCH_HEADER: ClassVar[Tuple[int, int, int]] = (0xA, 0xF4, 0x0)
+
+    @classmethod
+    def _get_match_header(cls) -> Optional[Tuple[int, int, int]]:
+        return cls._MATCH_HEADER
 
     @classmethod
     def match(cls, length: int, frame_type: int, address: int, data: List[int]) -> bool:
-        if length == 0xA and frame_type == 0xF4 and address == 0x0:
+        if (length, frame_type, address) == cls._MATCH_HEADER:
             return True
         return False
 
 
 class Time(TextDataFrame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Time"
     LENGTH: ClassVar[int] = 0x5
     TYPE: ClassVar[int] = 0xE0
@@ -550,15 +727,13 @@ class Time(TextDataFrame):
 
     @classmethod
     def from_time(cls, time: datetime.time) -> "Time":
-        data: List[int] = [
-            cls.UNICODE_TO_CASIO[c] for c in "%.2d:%.2d" % (time.hour, time.minute)
-        ]
+        data = cls._encode_text("%.2d:%.2d" % (time.hour, time.minute))
         return cls(
             length=cls.LENGTH,
             frame_type=cls.TYPE,
             address=cls.ADDRESS,
             data=data,
-            checksum=cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, data),
+            checksum=cls._calculate_class_checksum(data),
         )
 
     @property
@@ -574,16 +749,22 @@ class Time(TextDataFrame):
 
 
 class DeadlineTime(Time):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Deadline Time"
     TYPE: ClassVar[int] = 0xE4
 
 
 class ToDoAlarm(Time):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "To Do Alarm"
     TYPE: ClassVar[int] = 0xC4
 
 
 class Alarm(Time):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Alarm"
     TYPE: ClassVar[int] = 0xC0
 
@@ -595,12 +776,14 @@ class Priorities(Enum):
 
 
 class Priority(Frame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Priority"
     LENGTH: ClassVar[int] = 0x1
     TYPE: ClassVar[int] = 0x72
     ADDRESS: ClassVar[int] = 0x0
     _CODE_TO_PRIORITY: Dict[int, Priorities] = {
-        priority.value: priority for priority in list(Priorities)
+        priority.value: priority for priority in Priorities
     }
     _PRIORITY_TO_CODE: Dict[Priorities, int] = {
         priority: code for code, priority in _CODE_TO_PRIORITY.items()
@@ -627,7 +810,7 @@ class Priority(Frame):
             cls.TYPE,
             cls.ADDRESS,
             data,
-            cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, data),
+            cls._calculate_class_checksum(data),
         )
 
     @classmethod
@@ -636,7 +819,7 @@ class Priority(Frame):
             length == cls.LENGTH
             and frame_type == cls.TYPE
             and address == cls.ADDRESS
-            and data[0] in cls._CODE_TO_PRIORITY.keys()
+            and data[0] in cls._CODE_TO_PRIORITY
         ):
             return True
         return False
@@ -646,6 +829,8 @@ class Priority(Frame):
 
 
 class DayHighlight(Frame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Day Highlight"
     LENGTH: ClassVar[int] = 0x4
     TYPE: ClassVar[int] = 0xD0
@@ -662,41 +847,55 @@ class DayHighlight(Frame):
         if len(days) > cls.LENGTH * 8:
             raise ValueError("Invalid number of days")
 
-        data: List[int] = [0] * cls.LENGTH
-
+        mask = 0
         for day in days:
-            byte: int = int((day - 1) / 8)
-            bit: int = (day - 1) % 8
-            data[byte] |= 1 << bit
+            mask |= 1 << (day - 1)
 
-        data = list(reversed(data))
+        return cls.from_mask(mask)
+
+    # Bit (day - 1) of mask is set for each day
+    @classmethod
+    def from_mask(cls, mask: int) -> "DayHighlight":
+        data: List[int] = list(mask.to_bytes(cls.LENGTH, "big"))
 
         return cls(
             length=cls.LENGTH,
             frame_type=cls.TYPE,
             address=cls.ADDRESS,
             data=data,
-            checksum=cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, data),
+            checksum=cls._calculate_class_checksum(data),
         )
 
+    # Bit (day - 1) is set for each day
+    @property
+    def mask(self) -> int:
+        return int.from_bytes(bytes(self.data), "big")
+
     @property
     def days(self) -> Set[int]:
-        days: List[int] = []
-        for idx, data in enumerate(self.data):
-            for bit in range(8):
-                if data & (1 << bit):
-                    days.append((3 - idx) * 8 + bit + 1)
-        return set(days)
+        mask = self.mask
+        days: Set[int] = set()
+        while mask:
+            lowest_bit = mask & -mask
+            days.add(lowest_bit.bit_length())
+            mask ^= lowest_bit
+        return days
 
     def __str__(self) -> str:
         return f"{self.DESCRIPTION}: " + " ".join(str(day) for day in sorted(self.days))
 
 
 class DayColorHighlight(Frame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Day Color & Highlight"
     LENGTH: ClassVar[int] = 0x20
     TYPE: ClassVar[int] = 0x78
     ADDRESS: ClassVar[int] = 0x0
+    _INFO_TO_COLOR: ClassVar[Tuple[Optional[Colors], ...]] = tuple(
+        next((color for color in Colors if info & color.value), None)
+        for info in range(256)
+    )
 
     @classmethod
     def match(cls, length: int, frame_type: int, address: int, data: List[int]) -> bool:
@@ -724,28 +923,26 @@ class DayColorHighlight(Frame):
         for idx, color in enumerate(colors):
             data[idx] |= color.value
 
-        data = list(reversed(data))
+        data.reverse()
 
         return cls(
             length=cls.LENGTH,
             frame_type=cls.TYPE,
             address=cls.ADDRESS,
             data=data,
-            checksum=cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, data),
+            checksum=cls._calculate_class_checksum(data),
         )
 
     def _get_day_color_highlight(self) -> List[Tuple[Colors, bool]]:
+        info_to_color = self._INFO_TO_COLOR
         color_highlight: List[Tuple[Colors, bool]] = []
+        color: Colors
         for info in reversed(self.data):
-            color: Colors
-            for color_candidate in list(Colors):
-                if info & color_candidate.value:
-                    color = color_candidate
-                    break
-            highlight: bool = False
-            if info & 0x80:
-                highlight = True
-            color_highlight.append((color, highlight))
+            # Days without a color bit keep the previous day's color
+            color_candidate = info_to_color[info]
+            if color_candidate is not None:
+                color = color_candidate
+            color_highlight.append((color, bool(info & 0x80)))
         return color_highlight
 
     @property
@@ -783,6 +980,8 @@ class DayColorHighlight(Frame):
 
 
 class StartEndTime(TextDataFrame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "StartEndTime"
     LENGTH: ClassVar[int] = 0xB
     TYPE: ClassVar[int] = 0xE0
@@ -792,17 +991,16 @@ class StartEndTime(TextDataFrame):
     def from_start_end_times(
         cls, start_time: datetime.time, end_time: datetime.time
     ) -> "StartEndTime":
-        data: List[int] = [
-            cls.UNICODE_TO_CASIO[c]
-            for c in "%.2d:%.2d~%.2d:%.2d"
+        data = cls._encode_text(
+            "%.2d:%.2d~%.2d:%.2d"
             % (start_time.hour, start_time.minute, end_time.hour, end_time.minute)
-        ]
+        )
         return cls(
             length=cls.LENGTH,
             frame_type=cls.TYPE,
             address=cls.ADDRESS,
             data=data,
-            checksum=cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, data),
+            checksum=cls._calculate_class_checksum(data),
         )
 
     def _get_start_end_times(self) -> Tuple[datetime.time, Optional[datetime.time]]:
@@ -833,6 +1031,8 @@ class StartEndTime(TextDataFrame):
 
 
 class Illustration(Frame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Illustration"
     LENGTH: ClassVar[int] = 0x1
     TYPE: ClassVar[int] = 0x21
@@ -846,7 +1046,7 @@ class Illustration(Frame):
             cls.TYPE,
             cls.ADDRESS,
             data,
-            cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, data),
+            cls._calculate_class_checksum(data),
         )
 
     @property
@@ -864,6 +1064,8 @@ class Illustration(Frame):
 
 
 class Text(TextDataFrame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "Text"
     TYPE_LOW: ClassVar[int] = 0x80
     TYPE_HIGH: ClassVar[int] = 0x81
@@ -879,6 +1081,20 @@ class Text(TextDataFrame):
             return True
         return False
 
+    @classmethod
+    def _wrap(cls, line: str) -> List[str]:
+        # Lines that fit in a chunk are returned by textwrap as they are
+        if len(line) <= cls._MAX_CHUNK_SIZE:
+            return [line] if line else []
+        return textwrap.wrap(
+            line,
+            width=cls._MAX_CHUNK_SIZE,
+            expand_tabs=False,
+            replace_whitespace=False,
+            break_on_hyphens=False,
+            drop_whitespace=False,
+        )
+
     @classmethod
     def _from_text(
         cls, text: str, last: bool, address: int
@@ -896,14 +1112,7 @@ class Text(TextDataFrame):
         for idx, line in enumerate(lines):
             last = idx + 1 == len(lines)
 
-            for chunk in textwrap.wrap(
-                line,
-                width=cls._MAX_CHUNK_SIZE,
-                expand_tabs=False,
-                replace_whitespace=False,
-                break_on_hyphens=False,
-                drop_whitespace=False,
-            )[:3]:
+            for chunk in cls._wrap(line)[:3]:
                 if address >= (cls._MAX_CHUNK_SIZE * 2):
                     frame_type = cls.TYPE_HIGH
                     frame_address = address % (cls._MAX_CHUNK_SIZE * 2)
@@ -911,11 +1120,7 @@ class Text(TextDataFrame):
                     frame_type = cls.TYPE_LOW
                     frame_address = address
 
-                data: List[int] = []
-                for c in chunk:
-                    if c not in cls.UNICODE_TO_CASIO:
-                        raise ValueError(f"Invalid character: {repr(c)}")
-                    data.append(cls.UNICODE_TO_CASIO[c])
+                data = cls._encode_text(chunk)
                 if not last:
                     data.append(cls.UNICODE_TO_CASIO["\n"])
                 length = len(data)
@@ -958,11 +1163,13 @@ class Text(TextDataFrame):
 
 
 class EndOfRecord(Frame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "End Of Record"
     LENGTH: ClassVar[int] = 0x0
     TYPE: ClassVar[int] = 0x0
     ADDRESS: ClassVar[int] = 0x100
-    DATA: List[int] = []
+    DATA: ClassVar[Tuple[int, ...]] = ()
 
     @classmethod
     def match(cls, length: int, frame_type: int, address: int, data: List[int]) -> bool:
@@ -976,8 +1183,8 @@ class EndOfRecord(Frame):
             cls.LENGTH,
             cls.TYPE,
             cls.ADDRESS,
-            cls.DATA,
-            cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, cls.DATA),
+            list(cls.DATA),
+            cls._calculate_class_checksum(cls.DATA),
         )
 
     def __str__(self) -> str:
@@ -985,11 +1192,13 @@ class EndOfRecord(Frame):
 
 
 class EndOfTransmission(Frame):
+    __slots__ = ()
+
     DESCRIPTION: ClassVar[str] = "End Of Transmission"
     LENGTH: ClassVar[int] = 0x0
     TYPE: ClassVar[int] = 0x0
     ADDRESS: ClassVar[int] = 0xFF00
-    DATA: List[int] = []
+    DATA: ClassVar[Tuple[int, ...]] = ()
 
     @classmethod
     def match(cls, length: int, frame_type: int, address: int, data: List[int]) -> bool:
@@ -1003,8 +1212,8 @@ class EndOfTransmission(Frame):
             cls.LENGTH,
             cls.TYPE,
             cls.ADDRESS,
-            cls.DATA,
-            cls.calculate_checksum(cls.LENGTH, cls.TYPE, cls.ADDRESS, cls.DATA),
+            list(cls.DATA),
+            cls._calculate_class_checksum(cls.DATA),
         )
 
     def __str__(self) -> str:
@@ -1016,6 +1225,14 @@ class EndOfTransmission(Frame):
 ##
 
 
+_BUILDER_LENGTH = 0
+_BUILDER_TYPE = 1
+_BUILDER_ADDRESS_LOW = 2
+_BUILDER_ADDRESS_HIGH = 3
+_BUILDER_DATA = 4
+_BUILDER_CHECKSUM = 5
+
+
 class FrameBuilder:
     length: Optional[int]
     type: Optional[int]
@@ -1024,36 +1241,45 @@ class FrameBuilder:
     checksum: Optional[int]
 
     def __init__(self) -> None:
+        self._state = _BUILDER_LENGTH
         self.length: Optional[int] = None
         self.frame_type: Optional[int] = None
-        self._address_low: Optional[int] = None
-        self._address_high: Optional[int] = None
+        self._address_low = 0
+        self._address_high = 0
         self.address: Optional[int] = None
-        self._data_count: Optional[int] = None
+        self._data_count = 0
         self.data = []
         self.checksum: Optional[int] = None
 
     def add_data(self, data: int) -> Tuple[str, Optional[Frame]]:
-        if self.length is None:
+        state = self._state
+        # Data bytes are the most common, so they are checked first
+        if state == _BUILDER_DATA:
+            self.data.append(data)
+            self._data_count -= 1
+            if not self._data_count:
+                self._state = _BUILDER_CHECKSUM
+            return ("Data", None)
+        if state == _BUILDER_LENGTH:
             self.length = data
             self._data_count = self.length
+            self._state = _BUILDER_TYPE
             return ("Length", None)
-        if self.frame_type is None:
+        if state == _BUILDER_TYPE:
             self.frame_type = data
+            self._state = _BUILDER_ADDRESS_LOW
             return ("Type", None)
-        if self._address_low is None:
+        if state == _BUILDER_ADDRESS_LOW:
             self._address_low = data
+            self._state = _BUILDER_ADDRESS_HIGH
             return ("Address Low", None)
-        if self._address_high is None:
+        if state == _BUILDER_ADDRESS_HIGH:
             self._address_high = data
             self.address = (self._address_high << 8) | (self._address_low & 0xFF)
+            self._state = _BUILDER_DATA if self._data_count else _BUILDER_CHECKSUM
             return ("Address High", None)
-        if self._data_count:
-            self.data.append(data)
-            self._data_count -= 1
-            return ("Data", None)
         self.checksum = data
-        if self.address is None:
+        if self.length is None or self.frame_type is None or self.address is None:
             raise ValueError("Missing address")
         return (
             "Checksum",
@@ -5,6 +5,9 @@ from typing import ClassVar, Dict, List, Optional, Set, Type
 
 from . import frame as frame_mod
 
+# Separates the text fields of a record
+_FIELD_SEPARATOR = chr(0x1F)
+
 
 def _raw_list_to_text_list(raw_list: List[Optional[str]]) -> List[str]:
     text_list: List[str] = []
@@ -22,7 +25,9 @@ def _raw_list_to_text_list(raw_list: List[Optional[str]]) -> List[str]:
 
 
 class Record(ABC):
-    DESCRIPTION: str = "Record"
+    __slots__ = ()
+
+    DESCRIPTION: ClassVar[str] = "Record"
     DIRECTORY: ClassVar[Type[frame_mod.Directory]]
     DIRECTORY_TO_RECORD: Dict[Type[frame_mod.Directory], Type["Record"]] = {}
 
@@ -40,7 +45,7 @@ class Record(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Telephone(Record):
     name: str
     number: Optional[str]
@@ -55,76 +60,52 @@ class Telephone(Record):
 
     DIRECTORY: ClassVar[Type[frame_mod.Directory]] = frame_mod.TelephoneDirectory
 
-    DESCRIPTION: str = "Telephone"
+    DESCRIPTION: ClassVar[str] = "Telephone"
 
     def __post_init__(self) -> None:
         self.to_frames()
 
     def __str__(self) -> str:
-        info_str = f"Telephone: {repr(self.name)}"
-        if self.number is not None:
-            info_str += f", {repr(self.number)}"
-        if self.address is not None:
-            info_str += f", {repr(self.address)}"
-        if self.free1 is not None:
-            info_str += f", {repr(self.free1)}"
-        if self.free2 is not None:
-            info_str += f", {repr(self.free2)}"
-        if self.free3 is not None:
-            info_str += f", {repr(self.free3)}"
-        if self.free4 is not None:
-            info_str += f", {repr(self.free4)}"
-        if self.free5 is not None:
-            info_str += f", {repr(self.free5)}"
-        if self.free6 is not None:
-            info_str += f", {repr(self.free6)}"
+        info_list = [repr(self.name)]
+        info_list.extend(
+            repr(value)
+            for value in (
+                self.number,
+                self.address,
+                self.free1,
+                self.free2,
+                self.free3,
+                self.free4,
+                self.free5,
+                self.free6,
+            )
+            if value is not None
+        )
+        info_str = "Telephone: " + ", ".join(info_list)
         if self.color is not None:
             info_str += f" ({self.color.name})"
         return info_str
 
     @classmethod
     def from_frames(cls, frames: List[frame_mod.Frame]) -> "Telephone":
-        text = ""
+        texts: List[str] = []
         color: Optional[frame_mod.Colors] = None
         for f in frames:
             if isinstance(f, frame_mod.Color):
                 color = f.color
             elif isinstance(f, frame_mod.Text):
-                text += f.text
+                texts.append(f.text)
             else:
                 raise ValueError(f"Unknown frame type: {type(f)}")
-        fields: List[Optional[str]] = [
-            None if v == "" else v for v in text.split(chr(0x1F))
-        ]
+        text = "".join(texts)
+        fields: List[Optional[str]] = [v or None for v in text.split(_FIELD_SEPARATOR)]
         if not len(fields):
             raise ValueError("Missing name text frame")
-        name = fields[0]
+        (name, number, address, free1, free2, free3, free4, free5, free6) = (
+            fields + [None] * 9
+        )[:9]
         if name is None:
             raise ValueError("Missing name text field")
-        number = None
-        if len(fields) > 1:
-            number = fields[1]
-        address = None
-        if len(fields) > 2:
-            address = fields[2]
-        free1 = None
-        if len(fields) > 3:
-            free1 = fields[3]
-        free2 = None
-        if len(fields) > 4:
-            free2 = fields[4]
-        free3 = None
-        if len(fields) > 5:
-            free3 = fields[5]
-        free4 = None
-        if len(fields) > 6:
-            free4 = fields[6]
-        free5 = None
-        if len(fields) > 7:
-            free5 = fields[7]
-        free6 = None
-        if len(fields) > 8:
-            free6 = fields[8]
         return cls(
             name, number, address, free1, free2, free3, free4, free5, free6, color
         )
@@ -152,7 +133,7 @@ class Telephone(Record):
         return frames
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessCard(Record):
     employer: str
     name: str
@@ -168,7 +149,7 @@ class BusinessCard(Record):
 
     DIRECTORY: ClassVar[Type[frame_mod.Directory]] = frame_mod.BusinessCardDirectory
 
-    DESCRIPTION: str = "Business Card"
+    DESCRIPTION: ClassVar[str] = "Business Card"
 
     def __post_init__(self) -> None:
         self.to_frames()
@@ -178,50 +159,35 @@ class BusinessCard(Record):
 
     @classmethod
     def from_frames(cls, frames: List[frame_mod.Frame]) -> "BusinessCard":
-        text = ""
+        texts: List[str] = []
         color: Optional[frame_mod.Colors] = None
         for f in frames:
             if isinstance(f, frame_mod.Color):
                 color = f.color
             elif isinstance(f, frame_mod.Text):
-                text += f.text
+                texts.append(f.text)
             else:
                 raise ValueError(f"Unknown frame type: {type(f)}")
-        fields: List[Optional[str]] = [
-            None if v == "" else v for v in text.split(chr(0x1F))
-        ]
+        text = "".join(texts)
+        fields: List[Optional[str]] = [v or None for v in text.split(_FIELD_SEPARATOR)]
         if len(fields) < 2:
             raise ValueError("Missing name and / or employer text frame")
-        employer = fields[0]
+        (
+            employer,
+            name,
+            telephone_number,
+            telex_number,
+            fax_number,
+            position,
+            department,
+            po_box,
+            address,
+            memo,
+        ) = (fields + [None] * 10)[:10]
         if employer is None:
             raise ValueError("Missing employer")
-        name = fields[1]
         if name is None:
             raise ValueError("Missing name")
-        telephone_number = None
-        if len(fields) > 2:
-            telephone_number = fields[2]
-        telex_number = None
-        if len(fields) > 3:
-            telex_number = fields[3]
-        fax_number = None
-        if len(fields) > 4:
-            fax_number = fields[4]
-        position = None
-        if len(fields) > 5:
-            position = fields[5]
-        department = None
-        if len(fields) > 6:
-            department = fields[6]
-        po_box = None
-        if len(fields) > 7:
-            po_box = fields[7]
-        address = None
-        if len(fields) > 8:
-            address = fields[8]
-        memo = None
-        if len(fields) > 9:
-            memo = fields[9]
 
         return cls(
             employer,
@@ -261,14 +227,14 @@ class BusinessCard(Record):
         return frames
 
 
-@dataclass
+@dataclass(slots=True)
 class Memo(Record):
     text: str
     color: Optional[frame_mod.Colors]
 
     DIRECTORY: ClassVar[Type[frame_mod.Directory]] = frame_mod.MemoDirectory
 
-    DESCRIPTION: str = "Memo"
+    DESCRIPTION: ClassVar[str] = "Memo"
 
     def __post_init__(self) -> None:
         self.to_frames()
@@ -281,15 +247,16 @@ class Memo(Record):
 
     @classmethod
     def from_frames(cls, frames: List[frame_mod.Frame]) -> "Memo":
-        text = ""
+        texts: List[str] = []
         color: Optional[frame_mod.Colors] = None
         for f in frames:
             if isinstance(f, frame_mod.Color):
                 color = f.color
             elif isinstance(f, frame_mod.Text):
-                text += f.text
+                texts.append(f.text)
             else:
                 raise ValueError(f"Unknown frame type: {type(f)}")
+        text = "".join(texts)
 
         return cls(text, color)
 
@@ -307,7 +274,7 @@ CalendarDays = Set[int]
 CalendarDayColors = Optional[List[frame_mod.Colors]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Calendar(Record):
     year: int
     month: int
@@ -316,19 +283,20 @@ class Calendar(Record):
 
     DIRECTORY: ClassVar[Type[frame_mod.Directory]] = frame_mod.CalendarDirectory
 
-    DESCRIPTION: str = "Calendar"
+    DESCRIPTION: ClassVar[str] = "Calendar"
 
     def __post_init__(self) -> None:
         self.to_frames()
 
     def __str__(self) -> str:
-        info_list = []
-        for date in range(1, 32):
-            color = ""
-            if self.colors:
-                color = self.colors[date - 1].name[0].lower()
-            highlight = "*" if date in self.days else ""
-            info_list.append(f"{date}{color}{highlight}")
+        days = self.days
+        color_chars: List[str] = [""] * 31
+        if self.colors:
+            color_chars = [color.name[0].lower() for color in self.colors]
+        info_list = [
+            f"{date}{color_chars[date - 1]}{'*' if date in days else ''}"
+            for date in range(1, 32)
+        ]
         return f"{self.DESCRIPTION}: {self.year}-{self.month}: " + " ".join(info_list)
 
     @classmethod
@@ -346,11 +314,9 @@ class Calendar(Record):
                     raise ValueError("Missing month")
                 month = f.month
             elif isinstance(f, frame_mod.DayHighlight):
-                for day in f.days:
-                    days.add(day)
+                days.update(f.days)
             elif isinstance(f, frame_mod.DayColorHighlight):
-                for date in f.days:
-                    days.add(date)
+                days.update(f.days)
                 colors = f.colors
             else:
                 raise ValueError(f"Unknown frame type: {type(f)}")
@@ -375,7 +341,7 @@ class Calendar(Record):
         return frames
 
 
-@dataclass
+@dataclass(slots=True)
 class Schedule(Record):
     date: datetime.date
     start_time: Optional[datetime.time]
@@ -387,7 +353,7 @@ class Schedule(Record):
 
     DIRECTORY: ClassVar[Type[frame_mod.Directory]] = frame_mod.ScheduleDirectory
 
-    DESCRIPTION: str = "Schedule"
+    DESCRIPTION: ClassVar[str] = "Schedule"
 
     def __post_init__(self) -> None:
         if self.start_time is None and self.description is None:
@@ -478,7 +444,7 @@ class Schedule(Record):
         return frames
 
 
-@dataclass
+@dataclass(slots=True)
 class Reminder(Record):
     month: Optional[int]
     day: Optional[int]
@@ -488,7 +454,7 @@ class Reminder(Record):
 
     DIRECTORY: ClassVar[Type[frame_mod.Directory]] = frame_mod.ReminderDirectory
 
-    DESCRIPTION: str = "Reminder"
+    DESCRIPTION: ClassVar[str] = "Reminder"
 
     def __post_init__(self) -> None:
         if self.month is not None and self.day is None:
@@ -559,7 +525,7 @@ class Reminder(Record):
         return frames
 
 
-@dataclass
+@dataclass(slots=True)
 class ToDo(Record):
     deadline_date: Optional[datetime.date]
     deadline_time: Optional[datetime.time]
@@ -571,7 +537,7 @@ class ToDo(Record):
 
     DIRECTORY: ClassVar[Type[frame_mod.Directory]] = frame_mod.ToDoDirectory
 
-    DESCRIPTION: str = "To Do"
+    DESCRIPTION: ClassVar[str] = "To Do"
 
     def __post_init__(self) -> None:
         if self.deadline_time is not None and self.deadline_date is None:
@@ -670,7 +636,7 @@ class ToDo(Record):
         return frames
 
 
-@dataclass
+@dataclass(slots=True)
 class Expense(Record):
     date: datetime.date
     amount: float
@@ -683,75 +649,56 @@ class Expense(Record):
 
     DIRECTORY: ClassVar[Type[frame_mod.Directory]] = frame_mod.ExpenseManagerDirectory
 
-    DESCRIPTION: str = "Expense"
+    DESCRIPTION: ClassVar[str] = "Expense"
 
     def __post_init__(self) -> None:
         self.to_frames()
 
     def __str__(self) -> str:
-        info_str = f"Expense: {self.date}, Amount: {self.amount}"
-        if self.payment_type is not None:
-            info_str += f", Payment Type: {repr(self.payment_type)}"
-        if self.expense_type is not None:
-            info_str += f", Expense Type: {repr(self.expense_type)}"
-        if self.rcpt is not None:
-            info_str += f", rcpt: {repr(self.rcpt)}"
-        if self.bus is not None:
-            info_str += f", bus: {repr(self.bus)}"
-        if self.description is not None:
-            info_str += f", Description: {repr(self.description)}"
-        info_str += f" ({self.color})"
-        return info_str
+        info_list = [f"Expense: {self.date}", f"Amount: {self.amount}"]
+        info_list.extend(
+            f"{label}: {repr(value)}"
+            for label, value in (
+                ("Payment Type", self.payment_type),
+                ("Expense Type", self.expense_type),
+                ("rcpt", self.rcpt),
+                ("bus", self.bus),
+                ("Description", self.description),
+            )
+            if value is not None
+        )
+        return ", ".join(info_list) + f" ({self.color})"
 
     @classmethod
     def from_frames(cls, frames: List[frame_mod.Frame]) -> "Expense":
-        text = ""
+        texts: List[str] = []
         color: Optional[frame_mod.Colors] = None
         for f in frames:
             if isinstance(f, frame_mod.Color):
                 color = f.color
             elif isinstance(f, frame_mod.Text):
-                text += f.text
+                texts.append(f.text)
             else:
                 raise ValueError(f"Unknown frame type: {type(f)}")
-        fields: List[Optional[str]] = [
-            None if v == "" else v for v in text.split(chr(0x1F))
-        ]
+        text = "".join(texts)
+        fields: List[Optional[str]] = [v or None for v in text.split(_FIELD_SEPARATOR)]
 
         if len(fields) < 2:
             raise ValueError("Missing date and/or amount.")
 
-        date_str = fields[0]
+        (date_str, amount_str, payment_type, expense_type, rcpt, bus, description) = (
+            fields + [None] * 7
+        )[:7]
+
         assert date_str is not None
         year_str = date_str[0:4]
         month_str = date_str[4:6]
         day_str = date_str[6:8]
         date = datetime.date(int(year_str), int(month_str), int(day_str))
 
-        amount_str = fields[1]
         assert amount_str is not None
         amount = float(amount_str)
 
-        payment_type: Optional[str] = None
-        if len(fields) > 2:
-            payment_type = fields[2]
-
-        expense_type: Optional[str] = None
-        if len(fields) > 3:
-            expense_type = fields[3]
-
-        rcpt: Optional[str] = None
-        if len(fields) > 4:
-            rcpt = fields[4]
-
-        bus: Optional[str] = None
-        if len(fields) > 5:
-            bus = fields[5]
-
-        description: Optional[str] = None
-        if len(fields) > 6:
-            description = fields[6]
-
         return cls(
             date, amount, payment_type, expense_type, rcpt, bus, description, color
         )
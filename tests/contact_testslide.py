@@ -0,0 +1,264 @@
+import csv
+import datetime
+import os
+import tempfile
+from typing import List
+
+from testslide import TestCase
+
+import cdd_comm.contact as contact_mod
+
+ADDRESS_FIELDS: List[str] = [
+    "Type",
+    "Street",
+    "City",
+    "PO Box",
+    "Region",
+    "Postal Code",
+    "Country",
+    "Extended Address",
+]
+
+ORGANIZATION_FIELDS: List[str] = [
+    "Type",
+    "Name",
+    "Yomi Name",
+    "Title",
+    "Department",
+    "Symbol",
+    "Location",
+    "Job Description",
+]
+
+
+class GoogleCSVTest(TestCase):
+    CSV_FILES: List[str] = [
+        "Given Name,Family Name,E-mail 1 - Type,E-mail 1 - Value\n"
+        "Ann,Doe,* Home,ann@example.com ::: ann@example.org\n"
+        "Bob,,Work,bob@example.com\n",
+        "Given Name,Family Name,Phone 1 - Type,Phone 1 - Value\n"
+        "Carl,Roe,Mobile,+1 555\n",
+        "Given Name,Family Name\n" "Dave,Poe\n" "Ann,Doe\n",
+    ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+        self.paths: List[str] = []
+        for idx, content in enumerate(self.CSV_FILES):
+            path = os.path.join(self.tmp_dir, f"contacts{idx}.csv")
+            with open(path, "w", encoding="utf-8") as csv_file:
+                csv_file.write(content)
+            self.paths.append(path)
+
+    def _parse(self, rows: List[List[str]]) -> List[contact_mod.Contact]:
+        path = os.path.join(self.tmp_dir, "parse.csv")
+        with open(path, "w", newline="", encoding="utf-8") as csv_file:
+            csv.writer(csv_file).writerows(rows)
+        return list(contact_mod.GoogleCSV(path).parse())
+
+    def test_parse_many(self) -> None:
+        expected = [
+            contact
+            for path in self.paths
+            for contact in contact_mod.GoogleCSV(path).parse()
+        ]
+        # Order across files is not deterministic, so compare as a multiset
+        remaining = list(expected)
+        for contact in contact_mod.GoogleCSV.parse_many(self.paths, max_workers=2):
+            self.assertIn(contact, remaining)
+            remaining.remove(contact)
+        self.assertEqual(remaining, [])
+        self.assertEqual(len(expected), 5)
+
+    def test_parse(self) -> None:
+        (contact,) = self._parse(
+            [
+                [
+                    "Name Prefix",
+                    "Given Name",
+                    "Family Name",
+                    "Family Name Yomi",
+                    "Birthday",
+                    "Group Membership",
+                    "IM 1 - Service",
+                    "IM 1 - Value",
+                    "Event 1 - Type",
+                    "Event 1 - Value",
+                    "Custom Field 1 - Type",
+                    "Custom Field 1 - Value",
+                ],
+                [
+                    "Dr.",
+                    "Ann",
+                    "Doe",
+                    "Dou",
+                    "1980-02-03",
+                    "* myContacts ::: Friends",
+                    "Jabber ::: Skype",
+                    "ann@jabber.example ::: ann.doe",
+                    "Anniversary",
+                    "2010-06-01",
+                    "Shoe Size",
+                    "38",
+                ],
+            ]
+        )
+        self.assertEqual(contact.name, "Dr. Ann Doe")
+        self.assertEqual(contact.yomi_name, "Dou")
+        self.assertEqual(contact.additional_name, None)
+        self.assertEqual(contact.birthday, datetime.date(1980, 2, 3))
+        self.assertEqual(contact.group_membership, {"* myContacts", "Friends"})
+        self.assertEqual(
+            contact.ims, {"Jabber": {"ann@jabber.example"}, "Skype": {"ann.doe"}}
+        )
+        self.assertEqual(contact.events, {"Anniversary": datetime.date(2010, 6, 1)})
+        self.assertEqual(contact.custom_fields, {"Shoe Size": {"38"}})
+
+    def test_name(self) -> None:
+        contacts = self._parse(
+            [
+                ["Given Name", "Additional Name", "Family Name", "Name Suffix"],
+                ["Ann", "", "Doe", ""],
+                ["", "", "Doe", "Jr."],
+                ["", "", "", ""],
+            ]
+        )
+        self.assertEqual(
+            [contact.name for contact in contacts], ["Ann Doe", "Doe Jr.", ""]
+        )
+        self.assertEqual([contact.yomi_name for contact in contacts], ["", "", ""])
+
+    def test_addresses(self) -> None:
+        header = [
+            f"Address {index} - {field}" for index in (1, 2) for field in ADDRESS_FIELDS
+        ]
+        contacts = self._parse(
+            [
+                header,
+                [
+                    # Address 1: two addresses plus an empty one, which is skipped
+                    "Home",
+                    " ::: ".join(["1 Main St", "2 Side St", ""]),
+                    " ::: ".join(["Springfield", "", ""]),
+                    " ::: ".join(["", "", ""]),
+                    " ::: ".join(["IL", "", ""]),
+                    " ::: ".join(["62701", "", ""]),
+                    " ::: ".join(["US", "", ""]),
+                    " ::: ".join(["", "", ""]),
+                    # Address 2: same type and address as the first one
+                    "Home",
+                    "1 Main St",
+                    "Springfield",
+                    "",
+                    "IL",
+                    "62701",
+                    "US",
+                    "",
+                ],
+                ["Work", "1 Main St", "Springfield", "", "IL", "62701", "US", ""]
+                + [""] * len(ADDRESS_FIELDS),
+            ]
+        )
+        main_street = contact_mod.Address(
+            street="1 Main St",
+            city="Springfield",
+            po_box=None,
+            region="IL",
+            postal_code="62701",
+            country="US",
+            extended_address=None,
+        )
+        side_street = contact_mod.Address(
+            street="2 Side St",
+            city=None,
+            po_box=None,
+            region=None,
+            postal_code=None,
+            country=None,
+            extended_address=None,
+        )
+        self.assertEqual(contacts[0].addresses, {"Home": {main_street, side_street}})
+        self.assertEqual(contacts[1].addresses, {"Work": {main_street}})
+        # Equal addresses are shared between blocks and rows
+        (work_address,) = contacts[1].addresses["Work"]
+        self.assertTrue(
+            any(address is work_address for address in contacts[0].addresses["Home"])
+        )
+
+    def test_organizations(self) -> None:
+        header = [f"Organization 1 - {field}" for field in ORGANIZATION_FIELDS]
+        (contact,) = self._parse(
+            [
+                header,
+                [
+                    "Work",
+                    " ::: ".join(["ACME", "Initech"]),
+                    " ::: ".join(["", ""]),
+                    " ::: ".join(["Engineer", "Consultant"]),
+                    " ::: ".join(["R&D", ""]),
+                    " ::: ".join(["", ""]),
+                    " ::: ".join(["", ""]),
+                    " ::: ".join(["Builds things", ""]),
+                ],
+            ]
+        )
+        self.assertEqual(
+            contact.organizations,
+            {
+                "Work": {
+                    contact_mod.Organization(
+                        name="ACME",
+                        yomi_name=None,
+                        title="Engineer",
+                        department="R&D",
+                        symbol=None,
+                        location=None,
+                        job_description="Builds things",
+                    ),
+                    contact_mod.Organization(
+                        name="Initech",
+                        yomi_name=None,
+                        title="Consultant",
+                        department=None,
+                        symbol=None,
+                        location=None,
+                        job_description=None,
+                    ),
+                }
+            },
+        )
+
+    def test_incomplete_blocks(self) -> None:
+        (contact,) = self._parse(
+            [
+                [
+                    # Block 1 is complete, block 2 is missing and block 3 is
+                    # ignored as blocks are numbered consecutively
+                    "E-mail 1 - Type",
+                    "E-mail 1 - Value",
+                    "E-mail 3 - Type",
+                    "E-mail 3 - Value",
+                    # Missing Type
+                    "Phone 1 - Value",
+                    # Missing all fields but Type and Street
+                    "Address 1 - Type",
+                    "Address 1 - Street",
+                ],
+                [
+                    "Home",
+                    "ann@example.com",
+                    "Work",
+                    "ann@example.org",
+                    "+1 555",
+                    "Home",
+                    "1 Main St",
+                ],
+            ]
+        )
+        self.assertEqual(contact.emails, {"Home": {"ann@example.com"}})
+        self.assertEqual(contact.phones, {})
+        self.assertEqual(contact.addresses, {})
+        self.assertEqual(contact.given_name, None)
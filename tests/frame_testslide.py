@@ -1,5 +1,5 @@
 import datetime
-from typing import ClassVar, List, Set, Type, cast
+from typing import ClassVar, List, Optional, Set, Type, cast
 
 from testslide import TestCase
 
@@ -83,6 +83,22 @@ class FrameTest(TestCase):
             b":03EA370000010222",
         )
 
+    def test_bytes_out_of_range(self) -> None:
+        with self.assertRaises(ValueError):
+            frame_mod.Frame(
+                length=1, frame_type=2, address=3, data=[-1], checksum=0
+            ).bytes()
+        with self.assertRaises(ValueError):
+            frame_mod.Frame(
+                length=1, frame_type=2, address=3, data=[0], checksum=256
+            ).bytes()
+        with self.assertRaises(ValueError):
+            str(
+                frame_mod.Frame(
+                    length=1, frame_type=2, address=3, data=[-1], checksum=0
+                )
+            )
+
     def test_match(self) -> None:
         frame = frame_mod.Frame(
             length=3, frame_type=234, address=55, data=[0, 1, 2], checksum=34
@@ -94,6 +110,41 @@ class FrameTest(TestCase):
             frame.match(length=3, frame_type=232, address=55, data=[0, 1, 2])
         )
 
+    def test_match_key(self) -> None:
+        # from_data() dispatches on _get_match_header() and _get_match_data(), so
+        # they must agree with match()
+        for subclass in frame_mod.Frame.SUBCLASSES:
+            header = subclass._get_match_header()
+            if header is None:
+                continue
+            with self.subTest(subclass=subclass.__name__):
+                length, frame_type, address = header
+                match_data = subclass._get_match_data()
+                data: Optional[List[int]]
+                if match_data is None:
+                    data = next(
+                        (
+                            [value] * length
+                            for value in range(256)
+                            if subclass.match(*header, [value] * length)
+                        ),
+                        None,
+                    )
+                else:
+                    data = list(match_data)
+                assert data is not None
+                self.assertTrue(subclass.match(*header, data))
+                for other_header in [
+                    (length ^ 0xFF, frame_type, address),
+                    (length, frame_type ^ 0xFF, address),
+                    (length, frame_type, address ^ 0xFFFF),
+                ]:
+                    self.assertFalse(subclass.match(*other_header, data))
+                if match_data:
+                    self.assertFalse(
+                        subclass.match(*header, [data[0] ^ 0xFF] + data[1:])
+                    )
+
 
 class DirectoryTest(TestCase):
     def test_directory(self) -> None:
@@ -117,7 +168,7 @@ class DirectoryTest(TestCase):
                     length=frame_mod.Directory.LENGTH,
                     frame_type=frame_mod.Directory.TYPE,
                     address=frame_mod.Directory.ADDRESS,
-                    data=directory_class.DATA,
+                    data=list(directory_class.DATA),
                     checksum=0,
                 )
             )
@@ -267,6 +318,13 @@ class DateTest(TestCase):
         frame = self._get_date("2021-03-29")
         self.assertEqual(frame.date, datetime.date(2021, 3, 29))
 
+    def test_data_update(self) -> None:
+        frame = self._get_date("2021-03-29")
+        self.assertEqual(frame.year, 2021)
+        frame.data[:] = [ord(c) for c in "1999-05-06"]
+        self.assertEqual(frame.year, 1999)
+        self.assertEqual(frame.date, datetime.date(1999, 5, 6))
+
     def test_match(self) -> None:
         frame = self._get_date("----------")
         self.assertTrue(isinstance(frame, frame_mod.Date))
@@ -394,6 +452,14 @@ class DayHighlightTest(TestCase):
     def test_days(self) -> None:
         self.assertEqual(self.frame.days, {1, 10, 19, 28})
 
+    def test_from_mask(self) -> None:
+        frame = frame_mod.DayHighlight.from_mask(0x08040201)
+        self.assertEqual(frame.data, [8, 4, 2, 1])
+        self.assertTrue(frame.is_checksum_valid())
+
+    def test_mask(self) -> None:
+        self.assertEqual(self.frame.mask, 0x08040201)
+
     def test_match(self) -> None:
         self.assertTrue(isinstance(self.frame, frame_mod.DayHighlight))
 
@@ -478,6 +544,15 @@ class DayColorHighlightTest(TestCase):
             ],
         )
 
+    def test_data_update(self) -> None:
+        self.assertEqual(len(self.frame.days), 16)
+        colors = [frame_mod.Colors.ORANGE] * 31
+        self.frame.data[:] = frame_mod.DayColorHighlight.from_days_and_colors(
+            {2}, colors
+        ).data
+        self.assertEqual(self.frame.days, {2})
+        self.assertEqual(self.frame.colors, colors)
+
     def test_match(self) -> None:
         self.assertTrue(isinstance(self.frame, frame_mod.DayColorHighlight))
 